@@ -19,4 +19,7 @@ ANSI_RE = re.compile(r"\x1b(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 def strip_ansi(s: str) -> str:
     """Remove all ANSI escape sequences from *s*."""
+    # Most strings contain no escapes; skip the regex engine entirely then.
+    if "\x1b" not in s:
+        return s
     return ANSI_RE.sub("", s)
@@ -7,13 +7,16 @@ Port of: borders.go
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 
 
-@dataclass
+@dataclass(frozen=True)
 class Border:
     """Defines the rune strings used to draw each part of a border.
 
-    All fields default to empty string (no border character).
+    All fields default to empty string (no border character). Frozen so
+    the predefined factories below can hand out one shared instance each;
+    derive variants with ``dataclasses.replace``.
     """
 
     top: str = ""
@@ -57,6 +60,7 @@ def _border_edge_width(*parts: str) -> int:
 # ---------------------------------------------------------------------------
 
 
+@cache
 def normal_border() -> Border:
     """Single-line box drawing with 90-degree corners."""
     return Border(
@@ -76,6 +80,7 @@ def normal_border() -> Border:
     )
 
 
+@cache
 def rounded_border() -> Border:
     """Single-line box drawing with rounded corners."""
     return Border(
@@ -95,6 +100,7 @@ def rounded_border() -> Border:
     )
 
 
+@cache
 def thick_border() -> Border:
     """Heavy box drawing characters."""
     return Border(
@@ -114,6 +120,7 @@ def thick_border() -> Border:
     )
 
 
+@cache
 def double_border() -> Border:
     """Double-line box drawing characters."""
     return Border(
@@ -133,6 +140,7 @@ def double_border() -> Border:
     )
 
 
+@cache
 def ascii_border() -> Border:
     """Plain ASCII border using +, -, and |."""
     return Border(
@@ -152,6 +160,7 @@ def ascii_border() -> Border:
     )
 
 
+@cache
 def markdown_border() -> Border:
     """Pipe-and-dash border suitable for Markdown tables.
 
@@ -176,6 +185,7 @@ def markdown_border() -> Border:
     )
 
 
+@cache
 def hidden_border() -> Border:
     """Space characters — preserves layout spacing without visible lines."""
     return Border(
@@ -195,6 +205,7 @@ def hidden_border() -> Border:
     )
 
 
+@cache
 def block_border() -> Border:
     """Full block characters (█) on all sides."""
     return Border(
@@ -214,6 +225,7 @@ def block_border() -> Border:
     )
 
 
+@cache
 def outer_half_block_border() -> Border:
     """Half-block border that sits outside the frame."""
     return Border(
@@ -228,6 +240,7 @@ def outer_half_block_border() -> Border:
     )
 
 
+@cache
 def inner_half_block_border() -> Border:
     """Half-block border that sits inside the frame."""
     return Border(
@@ -9,6 +9,10 @@ from __future__ import annotations
 from .position import Position
 from .style import _visible_width
 
+# Padding runs are bounded by block-width differences; reuse one string
+# per run length instead of allocating " " * n for every padded line.
+_SPACES = tuple(" " * i for i in range(256))
+
 
 def join_horizontal(pos: Position, *strs: str) -> str:
     """Join text blocks side-by-side along a vertical axis.
@@ -21,34 +25,40 @@ def join_horizontal(pos: Position, *strs: str) -> str:
     if len(strs) == 1:
         return strs[0]
 
+    # Measure every line exactly once; the per-row loop below reuses these
+    # widths instead of re-walking each line per cell.
     blocks = [s.split("\n") for s in strs]
-    max_widths = [max((_visible_width(line) for line in b), default=0) for b in blocks]
+    widths = [[_visible_width(line) for line in b] for b in blocks]
+    max_widths = [max(w) for w in widths]
     max_height = max(len(b) for b in blocks)
 
     pos_clamped = max(0.0, min(1.0, float(pos)))
 
-    # Pad each block to max_height
+    # Pad each block (and its width list) to max_height
     for i, block in enumerate(blocks):
         if len(block) >= max_height:
             continue
         extra = max_height - len(block)
         if pos_clamped == 0.0:  # Top — append empty lines below
             blocks[i] = block + [""] * extra
+            widths[i] = widths[i] + [0] * extra
         elif pos_clamped == 1.0:  # Bottom — prepend empty lines above
             blocks[i] = [""] * extra + block
+            widths[i] = [0] * extra + widths[i]
         else:
             split = int(round(extra * pos_clamped))
             top = extra - split
             bottom = extra - top
             blocks[i] = [""] * top + block + [""] * bottom
+            widths[i] = [0] * top + widths[i] + [0] * bottom
 
     lines: list[str] = []
     for row in range(max_height):
         parts: list[str] = []
         for j, block in enumerate(blocks):
             line = block[row]
-            pad = max_widths[j] - _visible_width(line)
-            parts.append(line + " " * pad)
+            pad = max_widths[j] - widths[j][row]
+            parts.append(line + (_SPACES[pad] if pad < 256 else " " * pad))
         lines.append("".join(parts))
     return "\n".join(lines)
 
@@ -64,22 +74,24 @@ def join_vertical(pos: Position, *strs: str) -> str:
     if len(strs) == 1:
         return strs[0]
 
+    # Measure every line exactly once; the alignment loop reuses these
+    # widths instead of measuring each line a second time.
     blocks = [s.split("\n") for s in strs]
-    max_w = max(
-        (_visible_width(line) for block in blocks for line in block),
-        default=0,
-    )
+    widths = [[_visible_width(line) for line in b] for b in blocks]
+    max_w = max(max(w) for w in widths)
 
     pos_clamped = max(0.0, min(1.0, float(pos)))
 
     all_lines: list[str] = []
     for bi, block in enumerate(blocks):
+        block_widths = widths[bi]
         for li, line in enumerate(block):
-            w = max_w - _visible_width(line)
+            w = max_w - block_widths[li]
+            pad = _SPACES[w] if w < 256 else " " * w
             if pos_clamped == 0.0:
-                all_lines.append(line + " " * w)
+                all_lines.append(line + pad)
             elif pos_clamped == 1.0:
-                all_lines.append(" " * w + line)
+                all_lines.append(pad + line)
             else:
                 if w < 1:
                     all_lines.append(line)
@@ -87,5 +99,9 @@ def join_vertical(pos: Position, *strs: str) -> str:
                     split = int(round(w * pos_clamped))
                     right = w - split
                     left = w - right
-                    all_lines.append(" " * left + line + " " * right)
+                    all_lines.append(
+                        (_SPACES[left] if left < 256 else " " * left)
+                        + line
+                        + (_SPACES[right] if right < 256 else " " * right)
+                    )
     return "\n".join(all_lines)
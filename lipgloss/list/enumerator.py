@@ -27,16 +27,15 @@ _ABC_LEN = 26
 
 def Alphabet(items: "Items", i: int) -> str:
     """Alphabetical enumeration: A., B., … Z., AA., AB., …"""
-    if i >= _ABC_LEN * _ABC_LEN + _ABC_LEN:
-        return (
-            chr(ord("A") + i // _ABC_LEN // _ABC_LEN - 1)
-            + chr(ord("A") + (i // _ABC_LEN) % _ABC_LEN - 1)
-            + chr(ord("A") + i % _ABC_LEN)
-            + "."
-        )
-    if i >= _ABC_LEN:
-        return chr(ord("A") + i // _ABC_LEN - 1) + chr(ord("A") + i % _ABC_LEN) + "."
-    return chr(ord("A") + i % _ABC_LEN) + "."
+    # Bijective base-26: one tight divmod loop replaces the per-width
+    # branch ladder and extends naturally past three letters.
+    buf = bytearray()
+    n = i + 1
+    while n:
+        n, r = divmod(n - 1, _ABC_LEN)
+        buf.append(65 + r)
+    buf.reverse()
+    return buf.decode("ascii") + "."
 
 
 def Arabic(items: "Items", i: int) -> str:
@@ -44,17 +43,28 @@ def Arabic(items: "Items", i: int) -> str:
     return f"{i + 1}."
 
 
+_ROMAN_SYMBOLS = ("M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I")
+_ROMAN_VALUES = (1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1)
+# Conversions memoized by index: lists re-render the same small index
+# range, and classical numerals top out at 3999, so the dict stays tiny.
+_ROMAN_CACHE: dict[int, str] = {}
+
+
 def Roman(items: "Items", i: int) -> str:
     """Roman numeral enumeration: I., II., III., IV., …"""
-    roman = ["M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"]
-    arabic = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
+    cached = _ROMAN_CACHE.get(i)
+    if cached is not None:
+        return cached
+    n = i
     result: list[str] = []
-    for v, value in enumerate(arabic):
-        while i + 1 >= value:
-            i -= value
-            result.append(roman[v])
+    for v, value in enumerate(_ROMAN_VALUES):
+        while n + 1 >= value:
+            n -= value
+            result.append(_ROMAN_SYMBOLS[v])
     result.append(".")
-    return "".join(result)
+    s = "".join(result)
+    _ROMAN_CACHE[i] = s
+    return s
 
 
 def Bullet(items: "Items", i: int) -> str:
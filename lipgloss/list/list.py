@@ -25,7 +25,7 @@ from typing import Any, Callable
 
 from ..size import width as _vis_width
 from ..style import Style
-from .enumerator import Bullet
+from .enumerator import Asterisk, Bullet, Dash
 
 
 class Items:
@@ -106,7 +106,8 @@ class List:
         return str(self)
 
     def __str__(self) -> str:
-        if self._hidden:
+        # Hidden/empty lists bail before any enumerator or style work.
+        if self._hidden or not self._items:
             return ""
         return self._render("")
 
@@ -121,13 +122,25 @@ class List:
         items_obj = Items(self._items)
 
         # Build the styled prefix for each item and find the max width.
-        styled_prefixes: list[str] = []
-        for i in range(len(self._items)):
-            raw = self._enumerator(items_obj, i)
-            styled = self._enum_style.render(raw)
-            styled_prefixes.append(styled)
+        # Hidden sub-lists render nothing, so their enumerator never runs
+        # and their prefix doesn't influence alignment. The constant
+        # built-ins emit the same glyph for every index, so one render
+        # covers the whole list.
+        enum = self._enumerator
+        styled_prefixes: list[str | None] = []
+        if enum is Bullet or enum is Asterisk or enum is Dash:
+            shared = self._enum_style.render(enum(items_obj, 0))
+            styled_prefixes = [
+                None if isinstance(it, List) and it._hidden else shared for it in self._items
+            ]
+        else:
+            for i, it in enumerate(self._items):
+                if isinstance(it, List) and it._hidden:
+                    styled_prefixes.append(None)
+                    continue
+                styled_prefixes.append(self._enum_style.render(enum(items_obj, i)))
 
-        max_w = max((_vis_width(p) for p in styled_prefixes), default=0)
+        max_w = max((_vis_width(p) for p in styled_prefixes if p is not None), default=0)
 
         # Child indent = current prefix + spaces equal to the widest prefix.
         child_indent = prefix + " " * max_w
@@ -135,6 +148,8 @@ class List:
         lines: list[str] = []
         for i, it in enumerate(self._items):
             styled_prefix = styled_prefixes[i]
+            if styled_prefix is None:
+                continue
             prefix_w = _vis_width(styled_prefix)
 
             # Left-pad shorter prefixes so all items line up (right-align).
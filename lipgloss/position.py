@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from .style import _visible_width
+from .style import _char_width, _visible_width
 from .whitespace import WhitespaceOption, _Whitespace
 
 # Position is a float in [0.0, 1.0]:
@@ -40,13 +40,7 @@ def _render_whitespace(ws: _Whitespace, width: int, renderer: Any) -> str:
         out.append(ch)
         j = (j + 1) % len(runes)
         # advance by visible width of char (usually 1)
-        try:
-            from wcwidth import wcwidth  # type: ignore[import]
-
-            cw = wcwidth(ch)
-            i += cw if cw > 0 else 1
-        except ImportError:
-            i += 1
+        i += _char_width(ch) or 1
     result = "".join(out)
     # Pad any shortfall with spaces
     short = width - _visible_width(result)
@@ -92,7 +86,10 @@ def place_horizontal(
     from .renderer import default_renderer
 
     lines = s.split("\n")
-    content_width = max((_visible_width(ln) for ln in lines), default=0)
+    # Measure every line once up front; the widths are reused below when
+    # computing each line's shortfall.
+    widths = [_visible_width(ln) for ln in lines]
+    content_width = max(widths, default=0)
     gap = width - content_width
     if gap <= 0:
         return s
@@ -103,14 +100,32 @@ def place_horizontal(
     renderer = default_renderer()
 
     pos_clamped = max(0.0, min(1.0, float(pos)))
+    # Unstyled whitespace pads with plain spaces (chars defaults to " ",
+    # and _render_whitespace treats "" the same), so padding can use
+    # str.ljust/rjust (C-level) for ANSI-free ASCII lines and a bare
+    # space repeat otherwise, skipping _render_whitespace entirely.
+    plain = ws.chars in ("", " ") and ws.foreground is None and ws.background is None
     result: list[str] = []
-    for i, line in enumerate(lines):
-        short = max(0, content_width - _visible_width(line))
+    for line, line_w in zip(lines, widths):
+        if plain and "\x1b" not in line and line.isascii():
+            if pos_clamped == 0.0:  # Left
+                result.append(line.ljust(width))
+                continue
+            if pos_clamped == 1.0:  # Right
+                result.append(line.rjust(width))
+                continue
+        short = max(0, content_width - line_w)
         total_gap = gap + short
         if pos_clamped == 0.0:  # Left
-            result.append(line + _render_whitespace(ws, total_gap, renderer))
+            pad = " " * total_gap if plain else _render_whitespace(ws, total_gap, renderer)
+            result.append(line + pad)
         elif pos_clamped == 1.0:  # Right
-            result.append(_render_whitespace(ws, total_gap, renderer) + line)
+            pad = " " * total_gap if plain else _render_whitespace(ws, total_gap, renderer)
+            result.append(pad + line)
+        elif plain:
+            split = int(round(total_gap * pos_clamped))
+            left_n = total_gap - split
+            result.append(" " * left_n + line + " " * split)
         else:
             split = int(round(total_gap * pos_clamped))
             left_n = total_gap - split
@@ -146,21 +161,15 @@ def place_vertical(
     w = max((_visible_width(ln) for ln in lines), default=0)
     empty_line = _render_whitespace(ws, w, renderer)
 
+    # Exact-length list built via list repetition, joined once — no
+    # intermediate joins or string concatenation.
     pos_clamped = max(0.0, min(1.0, float(pos)))
     if pos_clamped == 0.0:  # Top
-        return s + "\n" + "\n".join(empty_line for _ in range(gap))
+        return "\n".join(lines + [empty_line] * gap)
     if pos_clamped == 1.0:  # Bottom
-        return "\n".join(empty_line for _ in range(gap)) + "\n" + s
+        return "\n".join([empty_line] * gap + lines)
     # Middle
     split = int(round(gap * pos_clamped))
     top = gap - split
     bottom = gap - top
-    top_lines = "\n".join(empty_line for _ in range(top))
-    bot_lines = "\n".join(empty_line for _ in range(bottom))
-    parts = []
-    if top_lines:
-        parts.append(top_lines)
-    parts.append(s)
-    if bot_lines:
-        parts.append(bot_lines)
-    return "\n".join(parts)
+    return "\n".join([empty_line] * top + lines + [empty_line] * bottom)
@@ -9,6 +9,7 @@ from __future__ import annotations
 import os
 import sys
 from enum import Enum, auto
+from functools import lru_cache
 from typing import IO, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -98,63 +99,70 @@ class Renderer:
         """Resolve a hex or ANSI index color string to an ANSI escape fragment.
 
         Returns an empty string for the ASCII profile (no color output).
-        Implementation detail used by Color.resolve().
+        Implementation detail used by Color.resolve(). Apps reuse a small
+        palette across renders, so results are memoized per
+        (color string, profile) — hex parsing and the ANSI256/ANSI16
+        degradation math run once per distinct color.
         """
-        profile = self.color_profile()
-        if profile == ColorProfile.ASCII:
-            return ""
-
-        color_str = color_str.strip()
-
-        if color_str.startswith("#"):
-            # True-color hex: #RRGGBB
-            hex_val = color_str.lstrip("#")
-            if len(hex_val) == 6:
-                r = int(hex_val[0:2], 16)
-                g = int(hex_val[2:4], 16)
-                b = int(hex_val[4:6], 16)
-                if profile == ColorProfile.TRUE_COLOR:
-                    return f"\x1b[38;2;{r};{g};{b}m"
-                # Degrade to ANSI256
-                idx = _rgb_to_ansi256(r, g, b)
-                if profile == ColorProfile.ANSI256:
-                    return f"\x1b[38;5;{idx}m"
-                # Degrade to ANSI16
-                ansi16 = _ansi256_to_ansi16(idx)
-                return _ansi16_fg_escape(ansi16)
-            return ""
-
-        # Numeric ANSI index string
-        try:
-            idx = int(color_str)
-        except ValueError:
-            return ""
-
-        if idx < 0:
-            return ""
+        return _resolve_color_cached(color_str, self.color_profile())
 
+
+@lru_cache(maxsize=512)
+def _resolve_color_cached(color_str: str, profile: ColorProfile) -> str:
+    """Resolution body behind Renderer._resolve_color_string's memo."""
+    if profile == ColorProfile.ASCII:
+        return ""
+
+    color_str = color_str.strip()
+
+    if color_str.isascii() and color_str.isdigit():
+        # Numeric ANSI index: both checks are C-level scans and together
+        # reject signs and non-ASCII digit-likes (superscripts, fractions)
+        # that int() would refuse, so no exception handling is needed.
+        idx = int(color_str)
         if idx < 16:
             # Basic ANSI color (0–15)
             return _ansi16_fg_escape(idx)
-
         if profile == ColorProfile.ANSI:
             # Degrade 256-color index to nearest ANSI16
             return _ansi16_fg_escape(_ansi256_to_ansi16(idx))
-
         # ANSI256 or TRUE_COLOR: emit 256-color escape
         return f"\x1b[38;5;{idx}m"
 
+    if color_str.startswith("#"):
+        # True-color hex: #RRGGBB
+        hex_val = color_str.lstrip("#")
+        if len(hex_val) == 6:
+            r = int(hex_val[0:2], 16)
+            g = int(hex_val[2:4], 16)
+            b = int(hex_val[4:6], 16)
+            if profile == ColorProfile.TRUE_COLOR:
+                return f"\x1b[38;2;{r};{g};{b}m"
+            # Degrade to ANSI256
+            idx = _rgb_to_ansi256(r, g, b)
+            if profile == ColorProfile.ANSI256:
+                return f"\x1b[38;5;{idx}m"
+            # Degrade to ANSI16
+            ansi16 = _ansi256_to_ansi16(idx)
+            return _ansi16_fg_escape(ansi16)
+
+    # Neither a digit string nor valid hex — unknown color form.
+    return ""
+
 
 # ---------------------------------------------------------------------------
 # Color-conversion helpers
 # ---------------------------------------------------------------------------
 
 
+# The 16 basic-palette escapes are fixed strings; build them at import so
+# resolving an ANSI16 color is an index, not an f-string format.
+_ANSI16_FG = tuple(f"\x1b[{30 + i}m" for i in range(8)) + tuple(f"\x1b[{90 + i}m" for i in range(8))
+
+
 def _ansi16_fg_escape(idx: int) -> str:
     """Return the ANSI escape for a basic 0–15 foreground color."""
-    if idx < 8:
-        return f"\x1b[{30 + idx}m"
-    return f"\x1b[{90 + idx - 8}m"
+    return _ANSI16_FG[idx]
 
 
 def _rgb_to_ansi256(r: int, g: int, b: int) -> int:
@@ -25,25 +25,22 @@ def style_runes(
     Consecutive characters sharing the same style are flushed as a single
     render call (mirrors the Go implementation).
     """
+    if not s:
+        return ""
+
+    # Track run boundaries and slice the input directly: one substring and
+    # one render per run, no per-character list building, one final join.
     index_set = set(indices)
-    runes = list(s)
     out: list[str] = []
-    group: list[str] = []
-    current_matched: bool | None = None
-
-    for i, ch in enumerate(runes):
+    start = 0
+    run_matched = 0 in index_set
+    for i in range(1, len(s)):
         is_matched = i in index_set
-        if current_matched is None:
-            current_matched = is_matched
-
-        next_matched = (i + 1) in index_set
-        group.append(ch)
-
-        # Flush when the style changes or we reach the last character.
-        if is_matched != next_matched or i == len(runes) - 1:
-            style = matched if is_matched else unmatched
-            out.append(style.render("".join(group)))
-            group = []
-            current_matched = None
-
+        if is_matched != run_matched:
+            style = matched if run_matched else unmatched
+            out.append(style.render(s[start:i]))
+            start = i
+            run_matched = is_matched
+    style = matched if run_matched else unmatched
+    out.append(style.render(s[start:]))
     return "".join(out)
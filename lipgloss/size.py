@@ -8,21 +8,51 @@ from __future__ import annotations
 
 from ._ansi import strip_ansi as _strip_ansi
 
+try:
+    from wcwidth import wcswidth as _wcswidth  # type: ignore[import]
+except ImportError:
+    _wcswidth = None
+
 
 def _visible_width(line: str) -> int:
-    """Return the visible cell width of a single line using wcwidth."""
-    try:
-        from wcwidth import wcswidth  # type: ignore[import]
+    """Return the visible cell width of a single line using wcwidth.
 
-        w = wcswidth(_strip_ansi(line))
-        return w if w >= 0 else len(_strip_ansi(line))
-    except ImportError:
-        return len(_strip_ansi(line))
+    Plain ASCII with no escape sequences — the common case — is just its
+    length; only other strings pay for stripping and the wcwidth walk.
+    """
+    if "\x1b" not in line and line.isascii():
+        return len(line)
+    stripped = _strip_ansi(line)
+    if _wcswidth is None:
+        return len(stripped)
+    w = _wcswidth(stripped)
+    return w if w >= 0 else len(stripped)
 
 
 def width(s: str) -> int:
     """Return the visible width of the widest line in *s*."""
-    return max((_visible_width(line) for line in s.split("\n")), default=0)
+    if "\x1b" in s:
+        # Strip escapes from the whole block in one regex pass instead of
+        # once per line.
+        s = _strip_ansi(s)
+    if s.isascii():
+        # Both checks are C-level scans (isascii is a flag read), and
+        # map(len, ...) keeps the per-line measurement in C too.
+        if "\n" not in s:
+            return len(s)
+        return max(map(len, s.split("\n")))
+    if _wcswidth is None:
+        if "\n" not in s:
+            return len(s)
+        return max(map(len, s.split("\n")))
+    best = 0
+    for line in s.split("\n"):
+        w = _wcswidth(line)
+        if w < 0:
+            w = len(line)
+        if w > best:
+            best = w
+    return best
 
 
 def height(s: str) -> int:
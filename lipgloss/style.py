@@ -7,17 +7,50 @@ Port of: style.go, set.go, get.go, unset.go
 from __future__ import annotations
 
 import re
-from copy import deepcopy
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, cast
 
 from ._ansi import ANSI_RE as _ANSI_RE
 
+try:
+    from wcwidth import wcswidth as _wcswidth  # type: ignore[import]
+    from wcwidth import wcwidth as _wcwidth  # type: ignore[import]
+except ImportError:
+    _wcswidth = None
+    _wcwidth = None
+
 if TYPE_CHECKING:
     from .borders import Border
     from .color import TerminalColor
     from .position import Position
     from .renderer import Renderer
 
+# The SGR reset closes every styled run; interned so all emit sites share
+# one object and its hash is computed once when used in cache keys.
+_RESET = sys.intern("\x1b[0m")
+
+# Properties that only influence SGR escape output. A style using nothing
+# outside this set is a no-op on the ASCII profile, where no escapes are
+# ever emitted, so render can pass the text through untouched.
+_SGR_ONLY_PROPS = frozenset(
+    {
+        "bold",
+        "italic",
+        "underline",
+        "strikethrough",
+        "reverse",
+        "blink",
+        "faint",
+        "foreground",
+        "background",
+        "underline_spaces",
+        "strikethrough_spaces",
+        "color_whitespace",
+        "tab_width",
+    }
+)
+
 
 class Style:
     """An immutable fluent builder for terminal styles.
@@ -39,54 +72,90 @@ class Style:
         print(style.render("Hello, kitty"))
     """
 
+    # Styles are allocated on every setter call, so keep instances lean:
+    # slots avoid a per-instance __dict__ and speed up attribute access.
+    __slots__ = ("_renderer", "_props", "_value", "_render_cache", "_sgr_cache")
+
+    # Cap on memoized render results held per style instance.
+    _RENDER_CACHE_MAX = 128
+
     def __init__(self, _renderer: "Renderer | None" = None) -> None:
         from .renderer import default_renderer
 
         self._renderer: Renderer = _renderer or default_renderer()
         self._props: dict[str, Any] = {}
         self._value: str = ""  # attached string set via set_string()
+        self._render_cache: dict[Any, str] = {}
+        self._sgr_cache: dict[Any, tuple[str, str, str]] = {}
 
     # ------------------------------------------------------------------
     # Core rendering
     # ------------------------------------------------------------------
 
     def render(self, *strings: str) -> str:
-        """Apply all set properties and return an ANSI-escaped string."""
-        strs = list(strings)
-        if self._value:
-            strs = [self._value] + strs
-        str_ = " ".join(strs)
-
-        # Collect property values
-        bold = self._get("bold", False)
-        italic = self._get("italic", False)
-        underline = self._get("underline", False)
-        strikethrough = self._get("strikethrough", False)
-        reverse = self._get("reverse", False)
-        blink = self._get("blink", False)
-        faint = self._get("faint", False)
-        underline_spaces = self._get("underline_spaces", False) or (
-            underline and self._get("underline_spaces", True)
+        """Apply all set properties and return an ANSI-escaped string.
+
+        Results are memoized per instance: styles are immutable once built,
+        so identical inputs under the same renderer state always produce the
+        same output. Styles with a transform are never cached since the
+        callable may not be pure.
+        """
+        cacheable = "transform" not in self._props
+        if cacheable:
+            renderer = self._renderer
+            key = (strings, renderer.color_profile(), renderer.has_dark_background())
+            cached = self._render_cache.get(key)
+            if cached is not None:
+                return cached
+        result = self._render(*strings)
+        if cacheable:
+            if len(self._render_cache) >= self._RENDER_CACHE_MAX:
+                self._render_cache.clear()
+            self._render_cache[key] = result
+        return result
+
+    def _render(self, *strings: str) -> str:
+        # set_string() already joined its arguments, so the common no-arg
+        # and single-arg calls need no join at all.
+        if not strings:
+            str_ = self._value
+        elif not self._value:
+            str_ = strings[0] if len(strings) == 1 else " ".join(strings)
+        else:
+            str_ = " ".join((self._value,) + strings)
+
+        # Collect property values via one bound dict.get — render reads ~25
+        # properties per call, so skipping the _get method dispatch adds up.
+        get = self._props.get
+        bold = get("bold", False)
+        italic = get("italic", False)
+        underline = get("underline", False)
+        strikethrough = get("strikethrough", False)
+        reverse = get("reverse", False)
+        blink = get("blink", False)
+        faint = get("faint", False)
+        underline_spaces = get("underline_spaces", False) or (
+            underline and get("underline_spaces", True)
         )
-        strikethrough_spaces = self._get("strikethrough_spaces", False) or (
-            strikethrough and self._get("strikethrough_spaces", True)
+        strikethrough_spaces = get("strikethrough_spaces", False) or (
+            strikethrough and get("strikethrough_spaces", True)
         )
-        color_whitespace = self._get("color_whitespace", True)
-        inline = self._get("inline", False)
-        max_width = self._get("max_width", 0)
-        max_height = self._get("max_height", 0)
-        width_ = self._get("width", 0)
-        height_ = self._get("height", 0)
-        h_align = self._get("align_horizontal", 0.0)
-        v_align = self._get("align_vertical", 0.0)
-        pad_top = self._get("padding_top", 0)
-        pad_right = self._get("padding_right", 0)
-        pad_bottom = self._get("padding_bottom", 0)
-        pad_left = self._get("padding_left", 0)
-        transform = self._get("transform")
-
-        fg_color = self._get("foreground")
-        bg_color = self._get("background")
+        color_whitespace = get("color_whitespace", True)
+        inline = get("inline", False)
+        max_width = get("max_width", 0)
+        max_height = get("max_height", 0)
+        width_ = get("width", 0)
+        height_ = get("height", 0)
+        h_align = get("align_horizontal", 0.0)
+        v_align = get("align_vertical", 0.0)
+        pad_top = get("padding_top", 0)
+        pad_right = get("padding_right", 0)
+        pad_bottom = get("padding_bottom", 0)
+        pad_left = get("padding_left", 0)
+        transform = get("transform")
+
+        fg_color = get("foreground")
+        bg_color = get("background")
 
         # Apply transform first
         if transform is not None:
@@ -96,11 +165,16 @@ class Style:
         if not self._props:
             return _maybe_convert_tabs(str_, self._get("tab_width", 4), self._is_set("tab_width"))
 
-        # Resolve colors to ANSI escape fragments
-        fg_esc = fg_color.resolve(self._renderer) if fg_color is not None else ""
-        bg_esc = bg_color.resolve(self._renderer) if bg_color is not None else ""
+        # SGR-only styles are no-ops on the ASCII profile (no escapes are
+        # emitted there); skip the styling pipeline. Single-line input only:
+        # multi-line text still needs the pipeline's width normalization,
+        # which pads every line to the widest regardless of profile.
+        if "\n" not in str_ and _SGR_ONLY_PROPS.issuperset(self._props):
+            from .renderer import ColorProfile
+
+            if self._renderer.color_profile() == ColorProfile.ASCII:
+                return _maybe_convert_tabs(str_, get("tab_width", 4), "tab_width" in self._props)
 
-        style_whitespace = reverse
         use_space_styler = (
             (underline and not underline_spaces)
             or (strikethrough and not strikethrough_spaces)
@@ -108,68 +182,34 @@ class Style:
             or strikethrough_spaces
         )
 
-        # Build SGR sequence for the main text styler
-        def _build_sgr(
-            bold: bool,
-            italic: bool,
-            underline: bool,
-            strikethrough: bool,
-            reverse: bool,
-            blink: bool,
-            faint: bool,
-            fg: str,
-            bg: str,
-        ) -> str:
-            params: list[str] = []
-            if bold:
-                params.append("1")
-            if faint:
-                params.append("2")
-            if italic:
-                params.append("3")
-            if underline:
-                params.append("4")
-            if blink:
-                params.append("5")
-            if reverse:
-                params.append("7")
-            if strikethrough:
-                params.append("9")
-            if fg:
-                # fg is already a full escape like \x1b[38;2;...m — extract params
-                params.extend(_extract_sgr_params(fg))
-            if bg:
-                params.extend(_extract_sgr_params(_fg_to_bg_escape(bg)))
-            return "\x1b[" + ";".join(params) + "m" if params else ""
-
-        main_sgr = _build_sgr(
-            bold, italic, underline, strikethrough, reverse, blink, faint, fg_esc, bg_esc
-        )
-        reset = "\x1b[0m" if main_sgr else ""
-
-        # Whitespace styler (for padding/margin background, reverse)
-        ws_params: list[str] = []
-        if reverse:
-            ws_params.append("7")
-        if fg_esc and style_whitespace:
-            ws_params.extend(_extract_sgr_params(fg_esc))
-        if bg_esc and color_whitespace:
-            ws_params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_esc)))
-        ws_sgr = "\x1b[" + ";".join(ws_params) + "m" if ws_params else ""
-        ws_reset = "\x1b[0m" if ws_sgr else ""
-
-        # Space styler (for underline/strikethrough on spaces)
-        sp_params: list[str] = []
-        if fg_esc:
-            sp_params.extend(_extract_sgr_params(fg_esc))
-        if bg_esc:
-            sp_params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_esc)))
-        if underline_spaces:
-            sp_params.append("4")
-        if strikethrough_spaces:
-            sp_params.append("9")
-        sp_sgr = "\x1b[" + ";".join(sp_params) + "m" if sp_params else ""
-        sp_reset = "\x1b[0m" if sp_sgr else ""
+        # Resolve colors and assemble the three SGR openers. Styles are
+        # immutable, so these vary only with renderer state — cache them
+        # per instance and repeat renders of *different* text skip color
+        # resolution and param extraction entirely.
+        renderer = self._renderer
+        sgr_key = (renderer.color_profile(), renderer.has_dark_background())
+        cached_sgrs = self._sgr_cache.get(sgr_key)
+        if cached_sgrs is not None:
+            main_sgr, ws_sgr, sp_sgr = cached_sgrs
+        else:
+            main_sgr, ws_sgr, sp_sgr = self._build_sgrs(
+                fg_color,
+                bg_color,
+                bold,
+                italic,
+                underline,
+                strikethrough,
+                reverse,
+                blink,
+                faint,
+                color_whitespace,
+                underline_spaces,
+                strikethrough_spaces,
+            )
+            self._sgr_cache[sgr_key] = (main_sgr, ws_sgr, sp_sgr)
+        reset = _RESET if main_sgr else ""
+        ws_reset = _RESET if ws_sgr else ""
+        sp_reset = _RESET if sp_sgr else ""
 
         def style_str(s: str) -> str:
             if not main_sgr:
@@ -187,7 +227,7 @@ class Style:
             return sp_sgr + s + sp_reset
 
         # Tab conversion
-        str_ = _maybe_convert_tabs(str_, self._get("tab_width", 4), self._is_set("tab_width"))
+        str_ = _maybe_convert_tabs(str_, get("tab_width", 4), "tab_width" in self._props)
         # Normalize carriage returns
         str_ = str_.replace("\r\n", "\n")
 
@@ -206,13 +246,7 @@ class Style:
         rendered_lines: list[str] = []
         for line in lines:
             if use_space_styler:
-                parts: list[str] = []
-                for ch in line:
-                    if ch == " " or ch == "\t":
-                        parts.append(style_sp(ch))
-                    else:
-                        parts.append(style_str(ch))
-                rendered_lines.append("".join(parts))
+                rendered_lines.append(_style_line(line, style_str, style_sp))
             else:
                 rendered_lines.append(style_str(line))
         str_ = "\n".join(rendered_lines)
@@ -225,10 +259,16 @@ class Style:
             if pad_right > 0:
                 pad_r = style_ws(" " * pad_right)
                 str_ = "\n".join(line + pad_r for line in str_.split("\n"))
-            if pad_top > 0:
-                str_ = "\n" * pad_top + str_
-            if pad_bottom > 0:
-                str_ = str_ + "\n" * pad_bottom
+            if pad_top > 0 or pad_bottom > 0:
+                # Assemble in one pass; repeated prefix concatenation would
+                # reallocate the full buffer per operation.
+                parts: list[str] = []
+                if pad_top > 0:
+                    parts.append("\n" * pad_top)
+                parts.append(str_)
+                if pad_bottom > 0:
+                    parts.append("\n" * pad_bottom)
+                str_ = "".join(parts)
 
         # Vertical alignment / height
         if height_ > 0:
@@ -237,9 +277,11 @@ class Style:
         # Horizontal alignment (also normalises line widths)
         num_lines = str_.count("\n")
         if num_lines != 0 or width_ != 0:
-            str_ = _align_text_horizontal(
-                str_, h_align, width_, style_ws if (color_whitespace or style_whitespace) else None
-            )
+            # Only pass a whitespace styler when it would actually emit
+            # escapes; None lets alignment use the plain str padding path.
+            # (reverse is what makes whitespace take the foreground styling.)
+            align_ws = style_ws if ws_sgr and (color_whitespace or reverse) else None
+            str_ = _align_text_horizontal(str_, h_align, width_, align_ws)
 
         if not inline:
             str_ = self._apply_border(str_)
@@ -257,39 +299,118 @@ class Style:
 
         return str_
 
+    def _build_sgrs(
+        self,
+        fg_color: "TerminalColor | None",
+        bg_color: "TerminalColor | None",
+        bold: bool,
+        italic: bool,
+        underline: bool,
+        strikethrough: bool,
+        reverse: bool,
+        blink: bool,
+        faint: bool,
+        color_whitespace: bool,
+        underline_spaces: bool,
+        strikethrough_spaces: bool,
+    ) -> tuple[str, str, str]:
+        """Assemble the (main, whitespace, space) SGR opener strings.
+
+        Called once per (profile, background) and memoized in _sgr_cache;
+        all SGR params for each styler are merged into a single escape.
+        The ASCII profile emits no escapes at all — attributes included —
+        matching termenv, where styling is a no-op on Ascii.
+        """
+        from .renderer import ColorProfile
+
+        if self._renderer.color_profile() == ColorProfile.ASCII:
+            return "", "", ""
+
+        fg_esc = fg_color.resolve(self._renderer) if fg_color is not None else ""
+        bg_esc = bg_color.resolve(self._renderer) if bg_color is not None else ""
+
+        style_whitespace = reverse
+
+        # Main text styler
+        params: list[str] = []
+        if bold:
+            params.append("1")
+        if faint:
+            params.append("2")
+        if italic:
+            params.append("3")
+        if underline:
+            params.append("4")
+        if blink:
+            params.append("5")
+        if reverse:
+            params.append("7")
+        if strikethrough:
+            params.append("9")
+        if fg_esc:
+            # fg_esc is already a full escape like \x1b[38;2;...m — extract params
+            params.extend(_extract_sgr_params(fg_esc))
+        if bg_esc:
+            params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_esc)))
+        main_sgr = "\x1b[" + ";".join(params) + "m" if params else ""
+
+        # Whitespace styler (for padding/margin background, reverse)
+        ws_params: list[str] = []
+        if reverse:
+            ws_params.append("7")
+        if fg_esc and style_whitespace:
+            ws_params.extend(_extract_sgr_params(fg_esc))
+        if bg_esc and color_whitespace:
+            ws_params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_esc)))
+        ws_sgr = "\x1b[" + ";".join(ws_params) + "m" if ws_params else ""
+
+        # Space styler (for underline/strikethrough on spaces)
+        sp_params: list[str] = []
+        if fg_esc:
+            sp_params.extend(_extract_sgr_params(fg_esc))
+        if bg_esc:
+            sp_params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_esc)))
+        if underline_spaces:
+            sp_params.append("4")
+        if strikethrough_spaces:
+            sp_params.append("9")
+        sp_sgr = "\x1b[" + ";".join(sp_params) + "m" if sp_params else ""
+
+        return main_sgr, ws_sgr, sp_sgr
+
     # ------------------------------------------------------------------
     # Border and margin application helpers
     # ------------------------------------------------------------------
 
     def _apply_border(self, str_: str) -> str:
-        border = self._get("border_style")
-        has_top = self._get("border_top", False)
-        has_right = self._get("border_right", False)
-        has_bottom = self._get("border_bottom", False)
-        has_left = self._get("border_left", False)
+        props = self._props
+        get = props.get
+        border = get("border_style")
+        has_top = get("border_top", False)
+        has_right = get("border_right", False)
+        has_bottom = get("border_bottom", False)
+        has_left = get("border_left", False)
 
         # If a border style is set but no sides explicitly chosen, show all sides.
-        if border is not None and not any(
-            [
-                self._is_set("border_top"),
-                self._is_set("border_right"),
-                self._is_set("border_bottom"),
-                self._is_set("border_left"),
-            ]
+        if border is not None and not (
+            "border_top" in props
+            or "border_right" in props
+            or "border_bottom" in props
+            or "border_left" in props
         ):
             has_top = has_right = has_bottom = has_left = True
 
         if border is None or not any([has_top, has_right, has_bottom, has_left]):
             return str_
 
-        top_fg = self._get("border_top_foreground")
-        right_fg = self._get("border_right_foreground")
-        bottom_fg = self._get("border_bottom_foreground")
-        left_fg = self._get("border_left_foreground")
-        top_bg = self._get("border_top_background")
-        right_bg = self._get("border_right_background")
-        bottom_bg = self._get("border_bottom_background")
-        left_bg = self._get("border_left_background")
+        top_fg = get("border_top_foreground")
+        right_fg = get("border_right_foreground")
+        bottom_fg = get("border_bottom_foreground")
+        left_fg = get("border_left_foreground")
+        top_bg = get("border_top_background")
+        right_bg = get("border_right_background")
+        bottom_bg = get("border_bottom_background")
+        left_bg = get("border_left_background")
 
         lines = str_.split("\n")
         content_width = max((_visible_width(ln) for ln in lines), default=0)
@@ -331,27 +452,30 @@ class Style:
                 params.extend(_extract_sgr_params(_fg_to_bg_escape(bg_e)))
             if not params:
                 return s
-            return "\x1b[" + ";".join(params) + "m" + s + "\x1b[0m"
+            return "\x1b[" + ";".join(params) + "m" + s + _RESET
 
         if has_top:
             top_str = _render_horizontal_edge(top_left, border.top, top_right, content_width)
             out.append(_style_border_part(top_str, top_fg, top_bg))
 
+        # Precompute the styled left/right cell for each line up front.  Side
+        # runes cycle when a border defines more than one, but each distinct
+        # rune is styled only once and reused.
+        def _side_cells(
+            runes: list[str], fg: "TerminalColor | None", bg: "TerminalColor | None"
+        ) -> list[str]:
+            if not runes:
+                return [""] * len(lines)
+            styled = {r: _style_border_part(r, fg, bg) for r in set(runes)}
+            n = len(runes)
+            return [styled[runes[i % n]] for i in range(len(lines))]
+
         left_runes = list(left_char) if left_char else []
         right_runes = list(right_char) if right_char else []
-        li = ri = 0
-        for i, line in enumerate(lines):
-            row = ""
-            if left_runes:
-                r = left_runes[li % len(left_runes)]
-                li += 1
-                row += _style_border_part(r, left_fg, left_bg)
-            row += line
-            if right_runes:
-                r = right_runes[ri % len(right_runes)]
-                ri += 1
-                row += _style_border_part(r, right_fg, right_bg)
-            out.append(row)
+        left_cells = _side_cells(left_runes, left_fg, left_bg)
+        right_cells = _side_cells(right_runes, right_fg, right_bg)
+        for lc, rc, line in zip(left_cells, right_cells, lines):
+            out.append(lc + line + rc)
 
         if has_bottom:
             bot_str = _render_horizontal_edge(
@@ -362,12 +486,13 @@ class Style:
         return "\n".join(out)
 
     def _apply_margins(self, str_: str) -> str:
-        top_margin = self._get("margin_top", 0)
-        right_margin = self._get("margin_right", 0)
-        bottom_margin = self._get("margin_bottom", 0)
-        left_margin = self._get("margin_left", 0)
+        get = self._props.get
+        top_margin = get("margin_top", 0)
+        right_margin = get("margin_right", 0)
+        bottom_margin = get("margin_bottom", 0)
+        left_margin = get("margin_left", 0)
 
-        margin_bg = self._get("margin_background")
+        margin_bg = get("margin_background")
 
         def style_margin(s: str) -> str:
             if margin_bg is None:
@@ -378,7 +503,7 @@ class Style:
             params = _extract_sgr_params(_fg_to_bg_escape(bg_e))
             if not params:
                 return s
-            return "\x1b[" + ";".join(params) + "m" + s + "\x1b[0m"
+            return "\x1b[" + ";".join(params) + "m" + s + _RESET
 
         if left_margin > 0:
             pad = style_margin(" " * left_margin)
@@ -391,10 +516,15 @@ class Style:
             lines = str_.split("\n")
             w = max((_visible_width(ln) for ln in lines), default=0)
             empty_line = style_margin(" " * w)
+            # Assemble in one pass; repeated prefix concatenation would
+            # reallocate the full buffer per operation.
+            parts: list[str] = []
             if top_margin > 0:
-                str_ = (empty_line + "\n") * top_margin + str_
+                parts.append((empty_line + "\n") * top_margin)
+            parts.append(str_)
             if bottom_margin > 0:
-                str_ = str_ + ("\n" + empty_line) * bottom_margin
+                parts.append(("\n" + empty_line) * bottom_margin)
+            str_ = "".join(parts)
 
         return str_
 
@@ -406,10 +536,18 @@ class Style:
     # ------------------------------------------------------------------
 
     def copy(self) -> "Style":
-        """Return an independent copy of this style."""
-        s = Style(_renderer=self._renderer)
-        s._props = deepcopy(self._props)
+        """Return an independent copy of this style.
+
+        Property values are shared, not deep-copied: setters always replace
+        values wholesale, so a shallow dict copy preserves immutability
+        semantics at a fraction of the cost.
+        """
+        s = cast("Style", Style.__new__(Style))
+        s._renderer = self._renderer
+        s._props = dict(self._props)
         s._value = self._value
+        s._render_cache = {}
+        s._sgr_cache = {}
         return s
 
     # Keys that are never inherited (matches Go's Inherit() exclusions).
@@ -437,7 +575,7 @@ class Style:
             if key in self._NO_INHERIT:
                 continue
             if key not in s._props:
-                s._props[key] = deepcopy(value)
+                s._props[key] = value
         return s
 
     def set_string(self, *strings: str) -> "Style":
@@ -460,6 +598,15 @@ class Style:
         s._props[key] = value
         return s
 
+    def _set_many(self, **kv: Any) -> "Style":
+        """Return a copy of this style with several keys set at once.
+
+        One copy instead of one per key — used by the multi-side setters.
+        """
+        s = self.copy()
+        s._props.update(kv)
+        return s
+
     def _unset(self, key: str) -> "Style":
         """Return a copy of this style with *key* removed."""
         s = self.copy()
@@ -689,11 +836,11 @@ class Style:
         :meth:`width` for a full explanation and examples.
         """
         top, right, bottom, left = _expand_sides(*values)
-        return (
-            self._set("padding_top", top)
-            ._set("padding_right", right)
-            ._set("padding_bottom", bottom)
-            ._set("padding_left", left)
+        return self._set_many(
+            padding_top=top,
+            padding_right=right,
+            padding_bottom=bottom,
+            padding_left=left,
         )
 
     def padding_top(self, n: int) -> "Style":
@@ -739,11 +886,11 @@ class Style:
     def margin(self, *values: int) -> "Style":
         """Set margins using CSS shorthand (1–4 values)."""
         top, right, bottom, left = _expand_sides(*values)
-        return (
-            self._set("margin_top", top)
-            ._set("margin_right", right)
-            ._set("margin_bottom", bottom)
-            ._set("margin_left", left)
+        return self._set_many(
+            margin_top=top,
+            margin_right=right,
+            margin_bottom=bottom,
+            margin_left=left,
         )
 
     def margin_top(self, n: int) -> "Style":
@@ -802,16 +949,16 @@ class Style:
         When *sides* has 1–4 values they follow CSS order (top, right,
         bottom, left).
         """
-        s = self._set("border_style", b)
-        if sides:
-            top, right, bottom, left = _expand_sides_bool(*sides)
-            s = (
-                s._set("border_top", top)
-                ._set("border_right", right)
-                ._set("border_bottom", bottom)
-                ._set("border_left", left)
-            )
-        return s
+        if not sides:
+            return self._set("border_style", b)
+        top, right, bottom, left = _expand_sides_bool(*sides)
+        return self._set_many(
+            border_style=b,
+            border_top=top,
+            border_right=right,
+            border_bottom=bottom,
+            border_left=left,
+        )
 
     def border_style(self, b: "Border") -> "Style":
         return self._set("border_style", b)
@@ -862,11 +1009,11 @@ class Style:
 
     def border_foreground(self, c: "TerminalColor") -> "Style":
         """Set foreground color for all four border sides."""
-        return (
-            self._set("border_top_foreground", c)
-            ._set("border_right_foreground", c)
-            ._set("border_bottom_foreground", c)
-            ._set("border_left_foreground", c)
+        return self._set_many(
+            border_top_foreground=c,
+            border_right_foreground=c,
+            border_bottom_foreground=c,
+            border_left_foreground=c,
         )
 
     def border_top_foreground(self, c: "TerminalColor") -> "Style":
@@ -909,11 +1056,11 @@ class Style:
 
     def border_background(self, c: "TerminalColor") -> "Style":
         """Set background color for all four border sides."""
-        return (
-            self._set("border_top_background", c)
-            ._set("border_right_background", c)
-            ._set("border_bottom_background", c)
-            ._set("border_left_background", c)
+        return self._set_many(
+            border_top_background=c,
+            border_right_background=c,
+            border_bottom_background=c,
+            border_left_background=c,
         )
 
     def border_top_background(self, c: "TerminalColor") -> "Style":
@@ -973,9 +1120,9 @@ class Style:
         return self._set("align_horizontal", v)
 
     def get_align_horizontal(self) -> "Position":
-        from .position import Left
-
-        return float(self._get("align_horizontal", Left))
+        # Default is position.Left (0.0); importing it here would be circular
+        # (position.py imports from this module) and costs a lookup per call.
+        return float(self._get("align_horizontal", 0.0))
 
     def unset_align_horizontal(self) -> "Style":
         return self._unset("align_horizontal")
@@ -984,9 +1131,8 @@ class Style:
         return self._set("align_vertical", v)
 
     def get_align_vertical(self) -> "Position":
-        from .position import Top
-
-        return float(self._get("align_vertical", Top))
+        # Default is position.Top (0.0); see get_align_horizontal.
+        return float(self._get("align_vertical", 0.0))
 
     def unset_align_vertical(self) -> "Style":
         return self._unset("align_vertical")
@@ -1073,43 +1219,57 @@ def _expand_sides_bool(*values: bool) -> tuple[bool, bool, bool, bool]:
 
 
 def _strip_ansi(s: str) -> str:
+    if "\x1b" not in s:
+        return s
     return _ANSI_RE.sub("", s)
 
 
+@lru_cache(maxsize=1024)
 def _char_width(ch: str) -> int:
+    # Cached so repeated lookups of the same codepoint (truncation, border
+    # edges) reduce to a single dict hit; printable ASCII is always width 1.
     if not ch:
         return 0
-    try:
-        from wcwidth import wcwidth  # type: ignore[import]
-
-        w = wcwidth(ch)
-        return w if w >= 0 else 1
-    except ImportError:
+    if " " <= ch <= "~":
         return 1
+    if _wcwidth is None:
+        return 1
+    w = _wcwidth(ch)
+    return w if w >= 0 else 1
 
 
+@lru_cache(maxsize=4096)
 def _visible_width(line: str) -> int:
+    # ASCII lines with no escapes — the overwhelmingly common case — need no
+    # regex stripping or wcwidth scan at all.
+    if not line:
+        return 0
+    if "\x1b" not in line and line.isascii():
+        return len(line)
     stripped = _strip_ansi(line)
-    try:
-        from wcwidth import wcswidth  # type: ignore[import]
-
-        w = wcswidth(stripped)
-        return w if w >= 0 else len(stripped)
-    except ImportError:
+    if stripped.isascii() or _wcswidth is None:
         return len(stripped)
+    w = _wcswidth(stripped)
+    return w if w >= 0 else len(stripped)
 
 
-def _extract_sgr_params(escape: str) -> list[str]:
-    """Extract the numeric params from a single SGR escape like \\x1b[38;2;1;2;3m."""
+@lru_cache(maxsize=512)
+def _extract_sgr_params(escape: str) -> tuple[str, ...]:
+    """Extract the numeric params from a single SGR escape like \\x1b[38;2;1;2;3m.
+
+    Cached (hence the immutable tuple result): a program uses only a handful
+    of distinct color escapes, so repeat parses are dict hits.
+    """
     if not escape:
-        return []
+        return ()
     m = re.match(r"\x1b\[([0-9;]*)m", escape)
     if not m:
-        return []
+        return ()
     raw = m.group(1)
-    return [p for p in raw.split(";") if p]
+    return tuple(p for p in raw.split(";") if p)
 
 
+@lru_cache(maxsize=512)
 def _fg_to_bg_escape(fg_escape: str) -> str:
     """Convert a foreground colour escape to its background equivalent."""
     if not fg_escape:
@@ -1142,13 +1302,44 @@ def _fg_to_bg_escape(fg_escape: str) -> str:
     return "\x1b[" + ";".join(out) + "m"
 
 
+# Runs of whitespace that take the space styler instead of the text styler.
+_SPACE_RUN_RE = re.compile(r"[ \t]+")
+
+
+def _style_line(
+    line: str,
+    style_str: "Callable[[str], str]",
+    style_sp: "Callable[[str], str]",
+) -> str:
+    """Style one line, applying *style_sp* to whitespace and *style_str* elsewhere.
+
+    Scans the line in whole runs via the regex engine rather than one
+    character at a time, so the interpreter-level loop runs once per span
+    instead of once per codepoint.
+    """
+    parts: list[str] = []
+    last = 0
+    for m in _SPACE_RUN_RE.finditer(line):
+        if m.start() > last:
+            parts.append(style_str(line[last : m.start()]))
+        parts.append(style_sp(m.group(0)))
+        last = m.end()
+    if last < len(line):
+        parts.append(style_str(line[last:]))
+    return "".join(parts)
+
+
+# Deletion table for tab_width=0: str.translate drops the tabs in one pass.
+_TAB_DELETE = {ord("\t"): None}
+
+
 def _maybe_convert_tabs(s: str, tab_width: int, explicit: bool) -> str:
     if not explicit:
         tab_width = 4
-    if tab_width == -1:
+    if tab_width == -1 or "\t" not in s:
         return s
     if tab_width == 0:
-        return s.replace("\t", "")
+        return s.translate(_TAB_DELETE)
     return s.replace("\t", " " * tab_width)
 
 
@@ -1156,6 +1347,9 @@ def _word_wrap(s: str, width: int) -> str:
     """Simple word-wrap that breaks long lines at *width* visible cells."""
     if width <= 0:
         return s
+    # Single line that already fits — no split/join round trip needed.
+    if "\n" not in s and _visible_width(s) <= width:
+        return s
     result_lines: list[str] = []
     for line in s.split("\n"):
         if _visible_width(line) <= width:
@@ -1179,23 +1373,35 @@ def _truncate_ansi(line: str, max_width: int) -> str:
     """Truncate an ANSI-escaped line to at most *max_width* visible cells."""
     if _visible_width(line) <= max_width:
         return line
+
+    def _take(seg: str, visible: int, out: list[str]) -> int:
+        """Append as much of the plain segment *seg* as fits; -1 on overflow."""
+        seg_w = _visible_width(seg)
+        if visible + seg_w <= max_width:
+            out.append(seg)
+            return visible + seg_w
+        # Overflow happens inside this segment — only here do we walk
+        # character by character to find the cut point.
+        for ch in seg:
+            cw = _char_width(ch)
+            if visible + cw > max_width:
+                break
+            out.append(ch)
+            visible += cw
+        return -1
+
+    # Segment the line at escape sequences so each plain run is measured in
+    # one call instead of one _char_width call per character.
     visible = 0
     out: list[str] = []
-    i = 0
-    while i < len(line):
-        # Check for ANSI escape sequence
-        m = _ANSI_RE.match(line, i)
-        if m:
-            out.append(m.group(0))
-            i = m.end()
-            continue
-        ch = line[i]
-        cw = _char_width(ch)
-        if visible + cw > max_width:
-            break
-        out.append(ch)
-        visible += cw
-        i += 1
+    last = 0
+    for m in _ANSI_RE.finditer(line):
+        visible = _take(line[last : m.start()], visible, out)
+        if visible < 0:
+            return "".join(out)
+        out.append(m.group(0))
+        last = m.end()
+    _take(line[last:], visible, out)
     return "".join(out)
 
 
@@ -1207,6 +1413,17 @@ def _align_text_horizontal(
 ) -> str:
     lines = str_.split("\n")
     widest = max((_visible_width(ln) for ln in lines), default=0)
+    # Lines of equal width need identical padding; build each styled pad
+    # string once per distinct shortfall instead of once per line.
+    pads: dict[int, str] = {}
+
+    def styled_pad(n: int) -> str:
+        p = pads.get(n)
+        if p is None:
+            p = style_ws(" " * n)  # type: ignore[misc]
+            pads[n] = p
+        return p
+
     result: list[str] = []
     for line in lines:
         line_w = _visible_width(line)
@@ -1216,25 +1433,28 @@ def _align_text_horizontal(
             result.append(line)
             continue
         pos_clamped = max(0.0, min(1.0, pos))
-        if pos_clamped == 1.0:  # Right
-            sp = " " * short
-            if style_ws:
-                sp = style_ws(sp)
-            result.append(sp + line)
+        if style_ws is None:
+            # Plain padding: let str.ljust/rjust build it in C. The
+            # target length is in characters, so add the shortfall to the raw
+            # length (ANSI escapes contribute to len but not to width).
+            target = len(line) + short
+            if pos_clamped == 1.0:  # Right
+                result.append(line.rjust(target))
+            elif pos_clamped == 0.5:  # Center
+                # Odd remainder goes on the right, matching Go's align.go;
+                # str.center puts it on the left.
+                left_n = short // 2
+                result.append(" " * left_n + line + " " * (short - left_n))
+            else:  # Left (default)
+                result.append(line.ljust(target))
+        elif pos_clamped == 1.0:  # Right
+            result.append(styled_pad(short) + line)
         elif pos_clamped == 0.5:  # Center
             left_n = short // 2
             right_n = left_n + short % 2
-            lsp = " " * left_n
-            rsp = " " * right_n
-            if style_ws:
-                lsp = style_ws(lsp)
-                rsp = style_ws(rsp)
-            result.append(lsp + line + rsp)
+            result.append(styled_pad(left_n) + line + styled_pad(right_n))
         else:  # Left (default)
-            sp = " " * short
-            if style_ws:
-                sp = style_ws(sp)
-            result.append(line + sp)
+            result.append(line + styled_pad(short))
     return "\n".join(result)
 
 
@@ -1260,6 +1480,16 @@ def _render_horizontal_edge(left: str, middle: str, right: str, width: int) -> s
         middle = " "
     left_w = _visible_width(left)
     right_w = _visible_width(right)
+
+    # Typical borders repeat a single-cell rune (or an ASCII run): build the
+    # edge with one string multiplication instead of cycling per cell.
+    fill = width - left_w
+    if len(middle) == 1 and _char_width(middle) == 1:
+        return left + middle * max(0, fill) + right
+    if middle.isascii():
+        reps = -(-fill // len(middle))  # ceil division
+        return left + (middle * max(0, reps))[:fill] + right
+
     runes = list(middle)
     j = 0
     out: list[str] = [left]
@@ -14,20 +14,32 @@ Internal function used by Table.render(); not part of the public API.
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
 from .._ansi import strip_ansi as _strip_ansi
 
+try:
+    from wcwidth import wcswidth as _wcswidth  # type: ignore[import]
+except ImportError:
+    _wcswidth = None
 
+
+@lru_cache(maxsize=4096)
 def _visible_width(s: str) -> int:
-    """Return the visible terminal width of *s*, stripping ANSI escapes."""
-    plain = _strip_ansi(s)
-    try:
-        from wcwidth import wcswidth  # type: ignore[import]
+    """Return the visible terminal width of *s*, stripping ANSI escapes.
 
-        w = wcswidth(plain)
-        return w if w >= 0 else len(plain)
-    except ImportError:
+    Cached: cell values repeat heavily across the statistics and wrapping
+    passes. ASCII strings with no escapes short-circuit to len().
+    """
+    if not s:
+        return 0
+    if "\x1b" not in s and s.isascii():
+        return len(s)
+    plain = _strip_ansi(s)
+    if plain.isascii() or _wcswidth is None:
         return len(plain)
+    w = _wcswidth(plain)
+    return w if w >= 0 else len(plain)
 
 
 def _median(values: list[int]) -> int:
@@ -41,21 +53,6 @@ def _median(values: list[int]) -> int:
     return (sorted_vals[mid - 1] + sorted_vals[mid]) // 2
 
 
-def _word_wrap_height(content: str, col_width: int) -> int:
-    """Estimate the number of lines after wrapping *content* at *col_width*."""
-    if col_width <= 0:
-        return 1
-    content = content.replace("\r\n", "\n")
-    total = 0
-    for line in content.split("\n"):
-        vis = _visible_width(line)
-        if vis == 0:
-            total += 1
-        else:
-            total += math.ceil(vis / col_width)
-    return total
-
-
 class _ResizerColumn:
     """Tracks per-column statistics used during width optimisation."""
 
@@ -64,7 +61,6 @@ class _ResizerColumn:
         self.min = min_w
         self.max = max_w
         self.median = median_w
-        self.rows: list[list[str]] = []
         self.x_padding: int = 0
         self.fixed_width: int = 0
 
@@ -96,21 +92,39 @@ class Resizer:
         self.border_column: bool = True
         self.y_paddings: list[list[int]] = []
 
-        # Build per-column statistics.
+        # One pass over all cells builds both shared matrices: the whole-cell
+        # widths feeding the column statistics and the per-line widths feeding
+        # the wrap-height pass. Single-line cells (the common case) are
+        # measured exactly once.
+        width_matrix: list[list[int]] = []
+        self._cell_line_widths: list[list[list[int]]] = []
         for row in self.all_rows:
-            for i, cell in enumerate(row):
-                cell_len = _visible_width(cell)
-                if len(self.columns) <= i:
-                    self.columns.append(_ResizerColumn(i, cell_len, cell_len, cell_len))
-                    continue
-                self.columns[i].rows.append(row)
-                self.columns[i].min = min(self.columns[i].min, cell_len)
-                self.columns[i].max = max(self.columns[i].max, cell_len)
-
-        # Compute median visible width for each column.
-        for j, col in enumerate(self.columns):
-            widths = [_visible_width(row[j]) for row in col.rows if j < len(row)]
-            col.median = _median(widths)
+            row_widths: list[int] = []
+            row_line_widths: list[list[int]] = []
+            for cell in row:
+                # Strip escapes once per cell; all width measurements below
+                # (whole cell and per line) then run on the plain string.
+                plain = _strip_ansi(cell)
+                w = _visible_width(plain)
+                row_widths.append(w)
+                if "\n" in plain or "\r" in plain:
+                    row_line_widths.append(
+                        [_visible_width(ln) for ln in plain.replace("\r\n", "\n").split("\n")]
+                    )
+                else:
+                    row_line_widths.append([w])
+            width_matrix.append(row_widths)
+            self._cell_line_widths.append(row_line_widths)
+
+        # Derive per-column min/max/median from the shared width matrix.
+        num_cols = max((len(row) for row in width_matrix), default=0)
+        for j in range(num_cols):
+            col_widths = [row[j] for row in width_matrix if len(row) > j]
+            # The median excludes the first row that introduced the column,
+            # matching the previous incremental behaviour.
+            self.columns.append(
+                _ResizerColumn(j, min(col_widths), max(col_widths), _median(col_widths[1:]))
+            )
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -138,71 +152,58 @@ class Resizer:
 
     def _expand_table_width(self) -> tuple[list[int], list[int]]:
         col_widths = self._max_column_widths()
-        _BIG = 2**31 - 1
-
-        while True:
-            total_width = sum(col_widths) + self._total_horizontal_border()
-            if total_width >= self.table_width:
-                break
 
-            shorter_idx = 0
-            shorter_width = _BIG
-            for j, w in enumerate(col_widths):
-                if w == self.columns[j].fixed_width:
-                    continue
-                if w < shorter_width:
-                    shorter_width = w
-                    shorter_idx = j
+        # The border contribution is loop-invariant; track the running total
+        # incrementally instead of re-summing every iteration.
+        total_width = sum(col_widths) + self._total_horizontal_border()
+        while total_width < self.table_width:
+            # min() keeps the comparison loop in C; ties resolve to the first
+            # (lowest-index) candidate, as before.
+            candidates = [
+                (w, j) for j, w in enumerate(col_widths) if w != self.columns[j].fixed_width
+            ]
+            shorter_idx = min(candidates, key=lambda t: t[0])[1] if candidates else 0
             col_widths[shorter_idx] += 1
+            total_width += 1
 
         return col_widths, self._expand_row_heights(col_widths)
 
     def _shrink_table_width(self) -> tuple[list[int], list[int]]:
         col_widths = self._max_column_widths()
+        border_width = self._total_horizontal_border()
 
         def shrink_biggest(very_big_only: bool) -> None:
-            while True:
-                total_width = sum(col_widths) + self._total_horizontal_border()
-                if total_width <= self.table_width:
+            total_width = sum(col_widths) + border_width
+            while total_width > self.table_width:
+                candidates = [
+                    (w, j)
+                    for j, w in enumerate(col_widths)
+                    if w != self.columns[j].fixed_width
+                    and (not very_big_only or w >= self.table_width // 2)
+                ]
+                if not candidates:
                     break
-
-                big_idx = -1
-                big_width = -(2**31)
-                for j, w in enumerate(col_widths):
-                    if w == self.columns[j].fixed_width:
-                        continue
-                    if very_big_only:
-                        if w >= self.table_width // 2 and w > big_width:
-                            big_width = w
-                            big_idx = j
-                    else:
-                        if w > big_width:
-                            big_width = w
-                            big_idx = j
-
-                if big_idx < 0 or col_widths[big_idx] == 0:
+                big_idx = max(candidates, key=lambda t: t[0])[1]
+                if col_widths[big_idx] == 0:
                     break
                 col_widths[big_idx] -= 1
+                total_width -= 1
 
         def shrink_to_median() -> None:
-            while True:
-                total_width = sum(col_widths) + self._total_horizontal_border()
-                if total_width <= self.table_width:
+            total_width = sum(col_widths) + border_width
+            while total_width > self.table_width:
+                candidates = [
+                    (w - self.columns[j].median, j)
+                    for j, w in enumerate(col_widths)
+                    if w != self.columns[j].fixed_width and w - self.columns[j].median > 0
+                ]
+                if not candidates:
                     break
-
-                biggest_diff = -(2**31)
-                biggest_diff_idx = -1
-                for j, w in enumerate(col_widths):
-                    if w == self.columns[j].fixed_width:
-                        continue
-                    diff = w - self.columns[j].median
-                    if diff > 0 and diff > biggest_diff:
-                        biggest_diff = diff
-                        biggest_diff_idx = j
-
-                if biggest_diff_idx < 0 or col_widths[biggest_diff_idx] == 0:
+                biggest_diff_idx = max(candidates, key=lambda t: t[0])[1]
+                if col_widths[biggest_diff_idx] == 0:
                     break
                 col_widths[biggest_diff_idx] -= 1
+                total_width -= 1
 
         shrink_biggest(True)
         shrink_to_median()
@@ -221,14 +222,22 @@ class Resizer:
         has_headers = bool(self.headers)
 
         for i, row in enumerate(self.all_rows):
-            for j, cell in enumerate(row):
+            for j in range(len(row)):
                 if has_headers and i == 0:
                     # Headers are always height 1.
                     continue
                 if j >= len(col_widths):
                     continue
                 avail = col_widths[j] - self._x_padding_for_col(j)
-                h = _word_wrap_height(cell, avail) + self._x_padding_for_cell(i, j)
+                # Wrap-height from the line widths cached at construction —
+                # no string splitting or re-measurement in this loop.
+                if avail <= 0:
+                    wrapped = 1
+                else:
+                    wrapped = sum(
+                        1 if w == 0 else math.ceil(w / avail) for w in self._cell_line_widths[i][j]
+                    )
+                h = wrapped + self._x_padding_for_cell(i, j)
                 if h > row_heights[i]:
                     row_heights[i] = h
         return row_heights
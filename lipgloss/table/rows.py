@@ -48,9 +48,19 @@ class StringData:
             self.append(list(row))
 
     def append(self, row: list[str]) -> None:
-        """Append a row to the data."""
-        self._columns = max(self._columns, len(row))
-        self._rows.append(list(row))
+        """Append a row to the data.
+
+        Rows are stored dense — padded with "" to the column count — so that
+        at() is a direct double index with a single bounds check.
+        """
+        row = list(row)
+        if len(row) > self._columns:
+            for existing in self._rows:
+                existing.extend([""] * (len(row) - self._columns))
+            self._columns = len(row)
+        elif len(row) < self._columns:
+            row.extend([""] * (self._columns - len(row)))
+        self._rows.append(row)
 
     def item(self, *cells: str) -> "StringData":
         """Append a row given as individual cell arguments."""
@@ -58,7 +68,7 @@ class StringData:
         return self
 
     def at(self, row: int, col: int) -> str:
-        if row >= len(self._rows) or col >= len(self._rows[row]):
+        if row >= len(self._rows) or col >= self._columns:
             return ""
         return self._rows[row][col]
 
@@ -84,23 +94,37 @@ class Filter:
         self._predicate: Callable[[int], bool] = (
             predicate if predicate is not None else (lambda _: True)
         )
+        # Lazily-built map of visible row index -> underlying row index.
+        self._index: list[int] | None = None
+        self._index_source_rows: int = -1
 
     def filter(self, predicate: Callable[[int], bool]) -> "Filter":
         """Set the filter predicate."""
         self._predicate = predicate
+        self._index = None
         return self
 
+    def _index_map(self) -> list[int]:
+        """Return the visible->underlying row index map, rebuilding if stale.
+
+        The predicate is evaluated once per underlying row instead of once
+        per at() call; the map is invalidated when the predicate changes or
+        the underlying data grows.
+        """
+        num_rows = self._data.rows()
+        if self._index is None or self._index_source_rows != num_rows:
+            self._index = [i for i in range(num_rows) if self._predicate(i)]
+            self._index_source_rows = num_rows
+        return self._index
+
     def at(self, row: int, col: int) -> str:
-        j = 0
-        for i in range(self._data.rows()):
-            if self._predicate(i):
-                if j == row:
-                    return self._data.at(i, col)
-                j += 1
+        index = self._index_map()
+        if 0 <= row < len(index):
+            return self._data.at(index[row], col)
         return ""
 
     def rows(self) -> int:
-        return sum(1 for i in range(self._data.rows()) if self._predicate(i))
+        return len(self._index_map())
 
     def columns(self) -> int:
         return self._data.columns()
@@ -22,21 +22,27 @@ HeaderRow sentinel constant: use in style_func to identify the header row (row =
 
 from __future__ import annotations
 
+import io
 from typing import Callable
 
 from ..borders import Border, rounded_border
 from ..join import join_horizontal
 from ..position import Top
 from ..size import height as _lipgloss_height
+from ..size import width as _lipgloss_width
 from ..style import Style
 from .resizing import Resizer
 from .rows import Data, StringData, data_to_matrix
 
 HeaderRow: int = -1
 
+# Style setters return copies, so one shared instance can back every
+# unstyled cell without risk of cross-cell mutation.
+_DEFAULT_STYLE = Style()
+
 
 def _default_styles(row: int, col: int) -> Style:
-    return Style()
+    return _DEFAULT_STYLE
 
 
 def _btoi(b: bool) -> int:
@@ -69,6 +75,24 @@ class Table:
         self._wrap: bool = True
         self._widths: list[int] = []
         self._heights: list[int] = []
+        # Dense cell matrix snapshotted from _data at the top of __str__ so
+        # the render loops index lists directly instead of calling Data.at.
+        self._matrix: list[list[str]] = []
+        # Headers padded out to the column count for the current render;
+        # computed per render so __str__ never mutates self._headers.
+        self._padded_headers: list[str] = []
+        # Per-render caches, reset at the top of __str__: border fragments
+        # passed through _border_style, per-cell margin sums, and the result
+        # of the (possibly user-supplied) style_func per cell.
+        self._border_cache: dict[str, str] = {}
+        self._margin_cache: dict[tuple[int, int], tuple[int, int]] = {}
+        self._style_cache: dict[tuple[int, int], Style] = {}
+        # Vertical border columns keyed by row height and horizontal fills
+        # keyed by column width, built in __str__ once sizing is known.
+        self._left_border_by_h: dict[int, str] = {}
+        self._right_border_by_h: dict[int, str] = {}
+        self._fill_top_by_w: dict[int, str] = {}
+        self._fill_bottom_by_w: dict[int, str] = {}
 
     # ------------------------------------------------------------------
     # Setters
@@ -160,52 +184,104 @@ class Table:
 
     def _get_style(self, row: int, col: int) -> Style:
         if self._style_func is None:
-            return Style()
-        return self._style_func(row, col)
+            return _DEFAULT_STYLE
+        # Each cell's style is requested from both _resize and the row
+        # constructors; call into the user's style_func only once per cell
+        # per render. Sharing the instance is safe: Style setters return
+        # copies, so downstream builder chains never mutate it.
+        cached = self._style_cache.get((row, col))
+        if cached is None:
+            cached = self._style_func(row, col)
+            self._style_cache[(row, col)] = cached
+        return cached
+
+    def _render_border(self, s: str) -> str:
+        """Render a border fragment with the table's border style, cached.
+
+        The same few glyphs (corners, junctions, edge fills) are styled over
+        and over while constructing a table; each distinct fragment is
+        rendered once per render() call.
+        """
+        cached = self._border_cache.get(s)
+        if cached is None:
+            cached = self._border_style.render(s)
+            self._border_cache[s] = cached
+        return cached
+
+    def _cell_margins(self, row: int, col: int) -> tuple[int, int]:
+        """Return (horizontal, vertical) margin sums for a cell, cached per render.
+
+        Only the row height varies while constructing a row; the margin
+        arithmetic is fixed per cell, so it is computed once even when the
+        table is rendered line by line.
+        """
+        cached = self._margin_cache.get((row, col))
+        if cached is None:
+            s = self._get_style(row, col)
+            cached = (
+                s.get_margin_left() + s.get_margin_right(),
+                s.get_margin_top() + s.get_margin_bottom(),
+            )
+            self._margin_cache[(row, col)] = cached
+        return cached
 
     def _resize(self) -> None:
         has_headers = bool(self._headers)
-        rows = data_to_matrix(self._data)
-        r = Resizer(self._width, self._height, self._headers, rows)
+        rows = self._matrix
+        r = Resizer(self._width, self._height, self._padded_headers, rows)
         r.wrap = self._wrap
         r.border_column = self._border_column
         r.y_paddings = [[] for _ in r.all_rows]
 
         all_rows: list[list[str]] = []
         if has_headers:
-            all_rows = [list(self._headers)] + rows
+            all_rows = [list(self._padded_headers)] + rows
         else:
             all_rows = rows
 
         r.row_heights = r._default_row_heights()
 
-        for i, row in enumerate(all_rows):
-            r.y_paddings[i] = [0] * len(row)
-            for j in range(len(row)):
-                if j >= len(r.columns):
-                    continue
-                col = r.columns[j]
-                row_index = i - _btoi(has_headers)
-                s = self._get_style(row_index, j)
-
-                total_h_padding = (
-                    s.get_margin_left()
-                    + s.get_margin_right()
-                    + s.get_padding_left()
-                    + s.get_padding_right()
-                )
-                col.x_padding = max(col.x_padding, total_h_padding)
-                col.fixed_width = max(col.fixed_width, s.get_width())
-
-                r.row_heights[i] = max(r.row_heights[i], s.get_height())
-
-                total_v_padding = (
-                    s.get_margin_top()
-                    + s.get_margin_bottom()
-                    + s.get_padding_top()
-                    + s.get_padding_bottom()
-                )
-                r.y_paddings[i][j] = total_v_padding
+        if self._style_func is _default_styles:
+            # The default style carries no margins, padding, or fixed sizes;
+            # the per-cell statistics pass below would only accumulate zeros.
+            for i, row in enumerate(all_rows):
+                r.y_paddings[i] = [0] * len(row)
+        else:
+            get_style = self._get_style
+            columns = r.columns
+            num_cols = len(columns)
+            row_heights = r.row_heights
+            header_offset = _btoi(has_headers)
+            for i, row in enumerate(all_rows):
+                y_padding = [0] * len(row)
+                r.y_paddings[i] = y_padding
+                row_index = i - header_offset
+                for j in range(min(len(row), num_cols)):
+                    col = columns[j]
+                    s = get_style(row_index, j)
+
+                    total_h_padding = (
+                        s.get_margin_left()
+                        + s.get_margin_right()
+                        + s.get_padding_left()
+                        + s.get_padding_right()
+                    )
+                    if total_h_padding > col.x_padding:
+                        col.x_padding = total_h_padding
+                    w = s.get_width()
+                    if w > col.fixed_width:
+                        col.fixed_width = w
+
+                    h = s.get_height()
+                    if h > row_heights[i]:
+                        row_heights[i] = h
+
+                    y_padding[j] = (
+                        s.get_margin_top()
+                        + s.get_margin_bottom()
+                        + s.get_padding_top()
+                        + s.get_padding_bottom()
+                    )
 
         self._widths, self._heights = r.optimized_widths()
 
@@ -214,138 +290,164 @@ class Table:
     # ------------------------------------------------------------------
 
     def _construct_top_border(self) -> str:
-        parts: list[str] = []
+        # Assemble the raw line and style it with one render call rather
+        # than wrapping every glyph in its own escape sequences.
+        buf = io.StringIO()
         if self._border_left:
-            parts.append(self._border_style.render(self._border.top_left))
+            buf.write(self._border.top_left)
         for i, w in enumerate(self._widths):
-            parts.append(self._border_style.render(self._border.top * w))
+            buf.write(self._fill_top_by_w[w])
             if i < len(self._widths) - 1 and self._border_column:
-                parts.append(self._border_style.render(self._border.middle_top))
+                buf.write(self._border.middle_top)
         if self._border_right:
-            parts.append(self._border_style.render(self._border.top_right))
-        return "".join(parts)
+            buf.write(self._border.top_right)
+        raw = buf.getvalue()
+        return self._border_style.render(raw) if raw else ""
 
     def _construct_bottom_border(self) -> str:
-        parts: list[str] = []
+        buf = io.StringIO()
         if self._border_left:
-            parts.append(self._border_style.render(self._border.bottom_left))
+            buf.write(self._border.bottom_left)
         for i, w in enumerate(self._widths):
-            parts.append(self._border_style.render(self._border.bottom * w))
+            buf.write(self._fill_bottom_by_w[w])
             if i < len(self._widths) - 1 and self._border_column:
-                parts.append(self._border_style.render(self._border.middle_bottom))
+                buf.write(self._border.middle_bottom)
         if self._border_right:
-            parts.append(self._border_style.render(self._border.bottom_right))
-        return "".join(parts)
+            buf.write(self._border.bottom_right)
+        raw = buf.getvalue()
+        return self._border_style.render(raw) if raw else ""
 
     def _construct_headers(self) -> str:
         height = self._heights[HeaderRow + 1]
-        parts: list[str] = []
+        buf = io.StringIO()
         if self._border_left:
-            parts.append(self._border_style.render(self._border.left))
-        for i, header in enumerate(self._headers):
+            buf.write(self._render_border(self._border.left))
+        for i, header in enumerate(self._padded_headers):
             cell_style = self._get_style(HeaderRow, i)
-            h_margins = cell_style.get_margin_left() + cell_style.get_margin_right()
-            v_margins = cell_style.get_margin_top() + cell_style.get_margin_bottom()
-            parts.append(
+            h_margins, v_margins = self._cell_margins(HeaderRow, i)
+            buf.write(
                 cell_style.height(height - v_margins)
                 .max_height(height)
                 .width(self._widths[i] - h_margins)
                 .max_width(self._widths[i])
                 .render(header)
             )
-            if i < len(self._headers) - 1 and self._border_column:
-                parts.append(self._border_style.render(self._border.left))
+            if i < len(self._padded_headers) - 1 and self._border_column:
+                buf.write(self._render_border(self._border.left))
 
         if self._border_header:
             if self._border_right:
-                parts.append(self._border_style.render(self._border.right))
-            parts.append("\n")
+                buf.write(self._render_border(self._border.right))
+            buf.write("\n")
+            # The separator line is pure border; render it in one call.
+            sep = io.StringIO()
             if self._border_left:
-                parts.append(self._border_style.render(self._border.middle_left))
-            for i in range(len(self._headers)):
-                parts.append(self._border_style.render(self._border.top * self._widths[i]))
-                if i < len(self._headers) - 1 and self._border_column:
-                    parts.append(self._border_style.render(self._border.middle))
+                sep.write(self._border.middle_left)
+            for i in range(len(self._padded_headers)):
+                sep.write(self._fill_top_by_w[self._widths[i]])
+                if i < len(self._padded_headers) - 1 and self._border_column:
+                    sep.write(self._border.middle)
             if self._border_right:
-                parts.append(self._border_style.render(self._border.middle_right))
+                sep.write(self._border.middle_right)
+            raw = sep.getvalue()
+            if raw:
+                buf.write(self._border_style.render(raw))
         elif self._border_right:
-            parts.append(self._border_style.render(self._border.right))
+            buf.write(self._render_border(self._border.right))
 
-        return "".join(parts)
+        return buf.getvalue()
 
-    def _construct_row(self, index: int, is_overflow: bool) -> str:
+    def _construct_row(self, index: int, is_overflow: bool, buf: io.StringIO) -> None:
         has_headers = bool(self._headers)
         height = self._heights[index + _btoi(has_headers)]
         if is_overflow:
             height = 1
 
         cells: list[str] = []
-        left_border = (self._border_style.render(self._border.left) + "\n") * height
+        left_border = self._left_border_by_h[height]
         if self._border_left:
             cells.append(left_border)
 
-        for c in range(self._data.columns()):
-            cell = "…" if is_overflow else self._data.at(index, c)
-            cell_style = self._get_style(index, c)
-            h_margins = cell_style.get_margin_left() + cell_style.get_margin_right()
-            v_margins = cell_style.get_margin_top() + cell_style.get_margin_bottom()
+        row = self._matrix[index]
+        last_col = len(row) - 1
+        border_column = self._border_column
+        widths = self._widths
+        get_style = self._get_style
+        cell_margins = self._cell_margins
+        for c in range(last_col + 1):
+            cell = "…" if is_overflow else row[c]
+            cell_style = get_style(index, c)
+            h_margins, v_margins = cell_margins(index, c)
             cells.append(
                 cell_style.height(height - v_margins)
                 .max_height(height)
-                .width(self._widths[c] - h_margins)
-                .max_width(self._widths[c])
+                .width(widths[c] - h_margins)
+                .max_width(widths[c])
                 .render(cell)
             )
-            if c < self._data.columns() - 1 and self._border_column:
+            if c < last_col and border_column:
                 cells.append(left_border)
 
         if self._border_right:
-            right_border = (self._border_style.render(self._border.right) + "\n") * height
-            cells.append(right_border)
+            cells.append(self._right_border_by_h[height])
 
         cells = [c.rstrip("\n") for c in cells]
-        result = join_horizontal(Top, *cells) + "\n"
-
-        if self._border_row and index < self._data.rows() - 1 and not is_overflow:
-            row_parts: list[str] = []
-            row_parts.append(self._border_style.render(self._border.middle_left))
+        # Cells were rendered to a uniform height and width above, so the
+        # general join_horizontal alignment is usually unnecessary: stitch
+        # the blocks together line by line. Fall back for the rare cell
+        # whose rendered height diverges (e.g. margin interplay) or whose
+        # lines are ragged (e.g. a double-width rune truncated by
+        # max_width leaves one line short) — join_horizontal pads those.
+        cell_lines = [c.split("\n") for c in cells]
+        if all(
+            len(cl) == height and len({_lipgloss_width(line) for line in cl}) <= 1
+            for cl in cell_lines
+        ):
+            buf.write("\n".join("".join(cl[i] for cl in cell_lines) for i in range(height)))
+        else:
+            buf.write(join_horizontal(Top, *cells))
+        buf.write("\n")
+
+    def _construct_row_with_sep(self, index: int, is_overflow: bool, buf: io.StringIO) -> None:
+        """Construct a row followed by the row separator where one belongs.
+
+        Split from _construct_row so renders with border_row disabled (the
+        default) never test for the separator in the per-row loop.
+        """
+        self._construct_row(index, is_overflow, buf)
+        if index < len(self._matrix) - 1 and not is_overflow:
+            sep = io.StringIO()
+            sep.write(self._border.middle_left)
             for i, w in enumerate(self._widths):
-                row_parts.append(self._border_style.render(self._border.bottom * w))
+                sep.write(self._fill_bottom_by_w[w])
                 if i < len(self._widths) - 1 and self._border_column:
-                    row_parts.append(self._border_style.render(self._border.middle))
-            row_parts.append(self._border_style.render(self._border.middle_right))
-            result += "".join(row_parts) + "\n"
-
-        return result
+                    sep.write(self._border.middle)
+            sep.write(self._border.middle_right)
+            buf.write(self._border_style.render(sep.getvalue()))
+            buf.write("\n")
 
-    def _construct_rows(self, available_lines: int) -> str:
-        parts: list[str] = []
-        offset_row_count = self._data.rows() - self._offset
+    def _construct_rows(self, available_lines: int, buf: io.StringIO) -> None:
+        total = len(self._matrix)
         rows_to_render = max(available_lines, 1)
-        needs_overflow = rows_to_render < offset_row_count
-
-        row_idx = self._offset
-        if not needs_overflow:
-            row_idx = self._data.rows() - rows_to_render
-
-        while rows_to_render > 0 and row_idx < self._data.rows():
-            is_overflow = needs_overflow and rows_to_render == 1
-            parts.append(self._construct_row(row_idx, is_overflow))
-            row_idx += 1
-            rows_to_render -= 1
+        needs_overflow = rows_to_render < total - self._offset
 
-        return "".join(parts)
+        start = self._offset if needs_overflow else total - rows_to_render
+        end = min(start + rows_to_render, total)
+        construct_row = self._construct_row_with_sep if self._border_row else self._construct_row
+        for idx in range(start, end):
+            # Only the last rendered row collapses into the overflow marker.
+            construct_row(idx, needs_overflow and idx == end - 1, buf)
 
     def _compute_height(self) -> int:
-        has_headers = bool(self._headers)
+        # Python bools sum as ints, so the flags need no conversion.
         return (
             sum(self._heights)
             - 1
-            + _btoi(has_headers)
-            + _btoi(self._border_top)
-            + _btoi(self._border_bottom)
-            + _btoi(self._border_header)
-            + self._data.rows() * _btoi(self._border_row)
+            + bool(self._headers)
+            + self._border_top
+            + self._border_bottom
+            + self._border_header
+            + len(self._matrix) * self._border_row
         )
 
     # ------------------------------------------------------------------
@@ -362,22 +464,50 @@ class Table:
         if not has_headers and not has_rows:
             return ""
 
-        # Pad headers to match column count.
+        self._border_cache = {}
+        self._margin_cache = {}
+        self._style_cache = {}
+        self._matrix = data_to_matrix(self._data)
+
+        # Pad headers to match the column count, without growing the
+        # user-supplied list on every render.
         if has_headers:
-            while len(self._headers) < self._data.columns():
-                self._headers.append("")
+            missing = self._data.columns() - len(self._headers)
+            self._padded_headers = self._headers + [""] * max(0, missing)
+        else:
+            self._padded_headers = []
 
         self._resize()
 
-        parts: list[str] = []
+        # Rows repeat the same few heights; build each vertical border column
+        # once per height rather than per row. Overflow rows are forced to
+        # height 1, so that entry is always present.
+        left_line = self._render_border(self._border.left) + "\n"
+        right_line = self._render_border(self._border.right) + "\n"
+        row_heights = set(self._heights)
+        row_heights.add(1)
+        self._left_border_by_h = {h: left_line * h for h in row_heights}
+        self._right_border_by_h = {h: right_line * h for h in row_heights}
+
+        # Column widths repeat too; multiply out each horizontal fill once
+        # per distinct width. Kept raw — whole border lines are styled in
+        # one render call by the constructors.
+        unique_w = set(self._widths)
+        self._fill_top_by_w = {w: self._border.top * w for w in unique_w}
+        self._fill_bottom_by_w = {w: self._border.bottom * w for w in unique_w}
+
+        # StringIO grows amortized in C with no per-fragment encode step;
+        # a presized bytearray with utf-8 round-trips measured ~5x slower
+        # for this write pattern, so no capacity hint is attempted.
+        buf = io.StringIO()
 
         if self._border_top:
-            parts.append(self._construct_top_border())
-            parts.append("\n")
+            buf.write(self._construct_top_border())
+            buf.write("\n")
 
         if has_headers:
-            parts.append(self._construct_headers())
-            parts.append("\n")
+            buf.write(self._construct_headers())
+            buf.write("\n")
 
         bottom = ""
         if self._border_bottom:
@@ -385,19 +515,25 @@ class Table:
 
         if self._data.rows() > 0:
             if self._use_manual_height:
-                top_height = _lipgloss_height("".join(parts)) - 1
+                top_height = _lipgloss_height(buf.getvalue()) - 1
                 available_lines = self._height - (top_height + _lipgloss_height(bottom))
                 if available_lines > self._data.rows():
                     available_lines = self._data.rows()
-                parts.append(self._construct_rows(available_lines))
+                self._construct_rows(available_lines, buf)
             else:
-                for r in range(self._offset, self._data.rows()):
-                    parts.append(self._construct_row(r, False))
+                construct_row = (
+                    self._construct_row_with_sep if self._border_row else self._construct_row
+                )
+                for r in range(self._offset, len(self._matrix)):
+                    construct_row(r, False, buf)
 
-        parts.append(bottom)
-        result = "".join(parts)
+        buf.write(bottom)
+        result = buf.getvalue()
 
         # Apply max constraints (width=0 means no limit, matching Go behaviour).
+        # This pass also trims the trailing newline and normalizes ragged
+        # line widths (e.g. row separators wider than a borderless bottom
+        # edge), so it runs even for tables with no explicit size.
         s = Style().max_height(self._compute_height())
         if self._width > 0:
             s = s.max_width(self._width)
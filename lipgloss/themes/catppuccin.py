@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from lipgloss.color import Color
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CatppuccinMochaTheme:
     """Catppuccin Mocha — a dark, warm, pastel color scheme.
 
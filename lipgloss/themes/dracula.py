@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from lipgloss.color import Color
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DraculaTheme:
     """Dracula — a dark theme with vivid accent colors.
 
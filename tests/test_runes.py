@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import re
+
 import lipgloss
 from lipgloss.runes import style_runes
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
-def _strip_ansi(s: str) -> str:
-    import re
 
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+def _strip_ansi(s: str) -> str:
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
 
 
 def test_style_runes_no_indices() -> None:
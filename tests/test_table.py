@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 
+import pytest
+
 import lipgloss
 from lipgloss.table import Filter, HeaderRow, StringData, Table
 from lipgloss.table.resizing import _median
@@ -13,8 +15,23 @@ from lipgloss.table.resizing import _median
 # ---------------------------------------------------------------------------
 
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
 def _strip_ansi(s: str) -> str:
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
+
+
+@pytest.fixture(scope="module")
+def xy_table() -> Table:
+    """Single-cell table shared by tests that only read its render output."""
+    return Table().headers("X").row("y")
+
+
+@pytest.fixture(scope="module")
+def sd_abcd() -> StringData:
+    """Four single-cell rows shared by Filter tests that never mutate it."""
+    return StringData(["A"], ["B"], ["C"], ["D"])
 
 
 # ---------------------------------------------------------------------------
@@ -70,9 +87,8 @@ def test_string_data_tracks_max_columns() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_filter_even_rows() -> None:
-    d = StringData(["A"], ["B"], ["C"], ["D"])
-    f = Filter(d).filter(lambda i: i % 2 == 0)
+def test_filter_even_rows(sd_abcd: StringData) -> None:
+    f = Filter(sd_abcd).filter(lambda i: i % 2 == 0)
     assert f.rows() == 2
     assert f.at(0, 0) == "A"
     assert f.at(1, 0) == "C"
@@ -90,25 +106,49 @@ def test_filter_no_predicate_passes_all() -> None:
     assert f.rows() == 3
 
 
-# ---------------------------------------------------------------------------
-# Resizer helper: _median
-# ---------------------------------------------------------------------------
+def test_filter_predicate_evaluated_once_per_row(sd_abcd: StringData) -> None:
+    calls: list[int] = []
 
+    def predicate(i: int) -> bool:
+        calls.append(i)
+        return i % 2 == 0
 
-def test_median_empty() -> None:
-    assert _median([]) == 0
+    f = Filter(sd_abcd, predicate)
+    for _ in range(3):
+        assert f.rows() == 2
+        assert f.at(0, 0) == "A"
+        assert f.at(1, 0) == "C"
+    # The row index is cached: one predicate call per underlying row,
+    # regardless of how many rows()/at() calls were made.
+    assert calls == [0, 1, 2, 3]
 
 
-def test_median_single() -> None:
-    assert _median([5]) == 5
+def test_filter_index_refreshes_when_data_grows() -> None:
+    d = StringData(["A"], ["B"])
+    f = Filter(d, lambda i: i % 2 == 0)
+    assert f.rows() == 1
+    d.append(["C"])
+    assert f.rows() == 2
+    assert f.at(1, 0) == "C"
 
 
-def test_median_odd() -> None:
-    assert _median([3, 1, 2]) == 2
+# ---------------------------------------------------------------------------
+# Resizer helper: _median
+# ---------------------------------------------------------------------------
 
 
-def test_median_even() -> None:
-    assert _median([4, 1, 3, 2]) == 2  # (2+3)//2 == 2
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        ([], 0),
+        ([5], 5),
+        ([3, 1, 2], 2),
+        ([4, 1, 3, 2], 2),  # (2+3)//2 == 2
+    ],
+    ids=["empty", "single", "odd", "even"],
+)
+def test_median(values: list[int], expected: int) -> None:
+    assert _median(values) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -136,9 +176,8 @@ def test_table_simple_rows() -> None:
     assert "25" in out
 
 
-def test_table_rounded_border_default() -> None:
-    t = Table().headers("X").row("y")
-    out = _strip_ansi(t.render())
+def test_table_rounded_border_default(xy_table: Table) -> None:
+    out = _strip_ansi(xy_table.render())
     # Rounded border characters
     assert "╭" in out
     assert "╰" in out
@@ -223,9 +262,8 @@ def test_table_fixed_width() -> None:
         assert len(line) <= 40, f"Line too long: {line!r}"
 
 
-def test_table_str_equals_render() -> None:
-    t = Table().headers("X").row("y")
-    assert str(t) == t.render()
+def test_table_str_equals_render(xy_table: Table) -> None:
+    assert str(xy_table) == xy_table.render()
 
 
 # ---------------------------------------------------------------------------
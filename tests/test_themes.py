@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+
+import pytest
+
 import lipgloss
 from lipgloss.color import Color, TerminalColor
 from lipgloss.themes import (
@@ -13,6 +18,10 @@ from lipgloss.themes import (
     gleam,
 )
 
+# dataclasses.fields() rebuilds its tuple on every call; the themes are a
+# handful of fixed classes, so cache per class for the whole suite.
+_fields = functools.lru_cache(maxsize=None)(dataclasses.fields)
+
 # ---------------------------------------------------------------------------
 # Module-level access via lipgloss.themes
 # ---------------------------------------------------------------------------
@@ -37,42 +46,6 @@ def test_catppuccin_mocha_is_correct_type() -> None:
     assert isinstance(catppuccin_mocha, CatppuccinMochaTheme)
 
 
-def test_catppuccin_mocha_all_colors_are_Color_instances() -> None:
-    import dataclasses
-
-    for field in dataclasses.fields(catppuccin_mocha):
-        value = getattr(catppuccin_mocha, field.name)
-        assert isinstance(value, Color), f"field {field.name!r} is not a Color"
-
-
-def test_catppuccin_mocha_all_colors_satisfy_protocol() -> None:
-    import dataclasses
-
-    for field in dataclasses.fields(catppuccin_mocha):
-        value = getattr(catppuccin_mocha, field.name)
-        assert isinstance(
-            value, TerminalColor
-        ), f"field {field.name!r} does not satisfy TerminalColor"
-
-
-def test_catppuccin_mocha_spot_check() -> None:
-    assert str(catppuccin_mocha.base) == "#1e1e2e"
-    assert str(catppuccin_mocha.mauve) == "#cba6f7"
-    assert str(catppuccin_mocha.text) == "#cdd6f4"
-    assert str(catppuccin_mocha.crust) == "#11111b"
-    assert str(catppuccin_mocha.green) == "#a6e3a1"
-
-
-def test_catppuccin_mocha_is_frozen() -> None:
-    assert catppuccin_mocha.__dataclass_params__.frozen  # type: ignore[attr-defined]
-
-
-def test_catppuccin_mocha_usable_in_style() -> None:
-    style = lipgloss.Style().foreground(catppuccin_mocha.mauve).background(catppuccin_mocha.base)
-    rendered = style.render("hi")
-    assert "hi" in rendered
-
-
 # ---------------------------------------------------------------------------
 # Dracula
 # ---------------------------------------------------------------------------
@@ -82,32 +55,6 @@ def test_dracula_is_correct_type() -> None:
     assert isinstance(dracula, DraculaTheme)
 
 
-def test_dracula_all_colors_are_Color_instances() -> None:
-    import dataclasses
-
-    for field in dataclasses.fields(dracula):
-        value = getattr(dracula, field.name)
-        assert isinstance(value, Color), f"field {field.name!r} is not a Color"
-
-
-def test_dracula_spot_check() -> None:
-    assert str(dracula.background) == "#282a36"
-    assert str(dracula.purple) == "#bd93f9"
-    assert str(dracula.foreground) == "#f8f8f2"
-    assert str(dracula.pink) == "#ff79c6"
-    assert str(dracula.comment) == "#6272a4"
-
-
-def test_dracula_is_frozen() -> None:
-    assert dracula.__dataclass_params__.frozen  # type: ignore[attr-defined]
-
-
-def test_dracula_usable_in_style() -> None:
-    style = lipgloss.Style().foreground(dracula.purple).background(dracula.background)
-    rendered = style.render("hi")
-    assert "hi" in rendered
-
-
 # ---------------------------------------------------------------------------
 # Gleam
 # ---------------------------------------------------------------------------
@@ -117,34 +64,79 @@ def test_gleam_is_correct_type() -> None:
     assert isinstance(gleam, GleamTheme)
 
 
-def test_gleam_all_colors_are_Color_instances() -> None:
-    import dataclasses
-
-    for field in dataclasses.fields(gleam):
-        value = getattr(gleam, field.name)
-        assert isinstance(value, Color), f"field {field.name!r} is not a Color"
-
-
-def test_gleam_spot_check() -> None:
-    assert str(gleam.faff_pink) == "#ffaff3"
-    assert str(gleam.underwater_blue) == "#292d3e"
-    assert str(gleam.white) == "#fefefc"
-    assert str(gleam.blue) == "#a6f0fc"
+# ---------------------------------------------------------------------------
+# Cross-theme: singletons are immutable and reusable
+# ---------------------------------------------------------------------------
 
 
-def test_gleam_is_frozen() -> None:
-    assert gleam.__dataclass_params__.frozen  # type: ignore[attr-defined]
+# One (theme, attribute, expected hex) triple per spot-checked color.
+_SPOT_CHECKS = [
+    (catppuccin_mocha, "base", "#1e1e2e"),
+    (catppuccin_mocha, "mauve", "#cba6f7"),
+    (catppuccin_mocha, "text", "#cdd6f4"),
+    (catppuccin_mocha, "crust", "#11111b"),
+    (catppuccin_mocha, "green", "#a6e3a1"),
+    (dracula, "background", "#282a36"),
+    (dracula, "purple", "#bd93f9"),
+    (dracula, "foreground", "#f8f8f2"),
+    (dracula, "pink", "#ff79c6"),
+    (dracula, "comment", "#6272a4"),
+    (gleam, "faff_pink", "#ffaff3"),
+    (gleam, "underwater_blue", "#292d3e"),
+    (gleam, "white", "#fefefc"),
+    (gleam, "blue", "#a6f0fc"),
+]
+
+
+@pytest.mark.parametrize(
+    "theme,attr,expected",
+    _SPOT_CHECKS,
+    ids=[f"{type(t).__name__}-{a}" for t, a, _ in _SPOT_CHECKS],
+)
+def test_theme_spot_check(theme: object, attr: str, expected: str) -> None:
+    assert str(getattr(theme, attr)) == expected
 
 
-def test_gleam_usable_in_style() -> None:
-    style = lipgloss.Style().foreground(gleam.faff_pink).background(gleam.underwater_blue)
+@pytest.mark.parametrize(
+    "theme",
+    [catppuccin_mocha, dracula, gleam],
+    ids=["catppuccin_mocha", "dracula", "gleam"],
+)
+def test_theme_is_frozen(theme: object) -> None:
+    assert theme.__dataclass_params__.frozen  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    "theme,fg,bg",
+    [
+        (catppuccin_mocha, "mauve", "base"),
+        (dracula, "purple", "background"),
+        (gleam, "faff_pink", "underwater_blue"),
+    ],
+    ids=["catppuccin_mocha", "dracula", "gleam"],
+)
+def test_theme_usable_in_style(theme: object, fg: str, bg: str) -> None:
+    style = lipgloss.Style().foreground(getattr(theme, fg)).background(getattr(theme, bg))
     rendered = style.render("hi")
     assert "hi" in rendered
 
 
-# ---------------------------------------------------------------------------
-# Cross-theme: singletons are immutable and reusable
-# ---------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "theme",
+    [catppuccin_mocha, dracula, gleam],
+    ids=["catppuccin_mocha", "dracula", "gleam"],
+)
+def test_theme_fields_are_colors(theme: object) -> None:
+    """Every theme field is a Color and satisfies the TerminalColor protocol.
+
+    Both checks share one pass over the fields so each value is read once.
+    """
+    for field in _fields(type(theme)):
+        value = getattr(theme, field.name)
+        assert isinstance(value, Color), f"field {field.name!r} is not a Color"
+        assert isinstance(
+            value, TerminalColor
+        ), f"field {field.name!r} does not satisfy TerminalColor"
 
 
 def test_singletons_are_identical_on_repeated_import() -> None:
@@ -155,15 +147,14 @@ def test_singletons_are_identical_on_repeated_import() -> None:
 
 
 def test_theme_color_is_valid_hex() -> None:
-    """Every hex color in every theme is a 7-char lowercase #rrggbb string."""
-    import dataclasses
-    import re
-
-    hex_re = re.compile(r"^#[0-9a-f]{6}$")
+    """Every hex color in every theme is a 7-char #rrggbb string."""
+    # Fixed-shape check: length + prefix + hex digits, case-insensitive like
+    # the old regex-on-lower() form but without the per-field allocation.
+    hex_digits = set("0123456789abcdefABCDEF")
     for theme in (catppuccin_mocha, dracula, gleam):
-        for field in dataclasses.fields(theme):  # type: ignore[arg-type]
+        for field in _fields(type(theme)):
             value = getattr(theme, field.name)
             if isinstance(value, Color):
-                assert hex_re.match(
-                    str(value).lower()
-                ), f"{type(theme).__name__}.{field.name} = {value!r} is not a valid #rrggbb hex"
+                s = str(value)
+                ok = len(s) == 7 and s[0] == "#" and all(c in hex_digits for c in s[1:])
+                assert ok, f"{type(theme).__name__}.{field.name} = {value!r} is not valid #rrggbb"
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import re
 
+import pytest
+
+import lipgloss
 from lipgloss.tree import (
     DefaultEnumerator,
     DefaultIndenter,
@@ -19,8 +22,33 @@ from lipgloss.tree import (
 # ---------------------------------------------------------------------------
 
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Characters a nested line may legitimately start with (indent or branch).
+_INDENT_PREFIX_CHARS = frozenset("│ ├└╰")
+
+
 def _strip_ansi(s: str) -> str:
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
+
+
+@pytest.fixture(scope="module")
+def nested_rendered() -> str:
+    """Stripped render of the shared Root/Foo/Bar/Baz nesting example.
+
+    Rendering is pure, so the tests asserting on this structure share one
+    render instead of rebuilding the same tree each.
+    """
+    t = (
+        Tree()
+        .root("Root")
+        .child(
+            "Foo",
+            Tree().root("Bar").child("Qux", "Quux"),
+            "Baz",
+        )
+    )
+    return _strip_ansi(t.render())
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +85,16 @@ def test_node_children_remove_out_of_bounds() -> None:
     assert nc2.length() == 1
 
 
+def test_tree_child_appends_in_place() -> None:
+    # The tree-owned children list is thawed, so building up a tree reuses
+    # one NodeChildren instead of copying the node list per append.
+    t = Tree().root(".")
+    nc = t._children
+    t.child("a", "b", "c")
+    assert t._children is nc
+    assert nc.length() == 3
+
+
 # ---------------------------------------------------------------------------
 # Leaf
 # ---------------------------------------------------------------------------
@@ -101,6 +139,8 @@ def test_leaf_str() -> None:
 class _NC:
     """Minimal NodeChildren stub for enumerator tests."""
 
+    __slots__ = ("_n",)
+
     def __init__(self, n: int) -> None:
         self._n = n
 
@@ -111,35 +151,33 @@ class _NC:
         return None
 
 
+# Enumerators only read length(); every test below uses the same size.
+_NC3 = _NC(3)
+
+
 def test_default_enumerator_middle() -> None:
-    nc = _NC(3)
-    assert DefaultEnumerator(nc, 0) == "├──"
-    assert DefaultEnumerator(nc, 1) == "├──"
+    assert DefaultEnumerator(_NC3, 0) == "├──"
+    assert DefaultEnumerator(_NC3, 1) == "├──"
 
 
 def test_default_enumerator_last() -> None:
-    nc = _NC(3)
-    assert DefaultEnumerator(nc, 2) == "└──"
+    assert DefaultEnumerator(_NC3, 2) == "└──"
 
 
 def test_rounded_enumerator_middle() -> None:
-    nc = _NC(3)
-    assert RoundedEnumerator(nc, 0) == "├──"
+    assert RoundedEnumerator(_NC3, 0) == "├──"
 
 
 def test_rounded_enumerator_last() -> None:
-    nc = _NC(3)
-    assert RoundedEnumerator(nc, 2) == "╰──"
+    assert RoundedEnumerator(_NC3, 2) == "╰──"
 
 
 def test_default_indenter_middle() -> None:
-    nc = _NC(3)
-    assert DefaultIndenter(nc, 0) == "│  "
+    assert DefaultIndenter(_NC3, 0) == "│  "
 
 
 def test_default_indenter_last() -> None:
-    nc = _NC(3)
-    assert DefaultIndenter(nc, 2) == "   "
+    assert DefaultIndenter(_NC3, 2) == "   "
 
 
 # ---------------------------------------------------------------------------
@@ -199,17 +237,8 @@ def test_tree_single_child() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_tree_nested_children() -> None:
-    t = (
-        Tree()
-        .root("Root")
-        .child(
-            "Foo",
-            Tree().root("Bar").child("Qux", "Quux"),
-            "Baz",
-        )
-    )
-    out = _strip_ansi(t.render())
+def test_tree_nested_children(nested_rendered: str) -> None:
+    out = nested_rendered
     assert "Root" in out
     assert "Foo" in out
     assert "Bar" in out
@@ -218,24 +247,18 @@ def test_tree_nested_children() -> None:
     assert "Baz" in out
 
 
-def test_tree_nested_indentation() -> None:
-    t = (
-        Tree()
-        .root("Root")
-        .child(
-            "Foo",
-            Tree().root("Bar").child("Qux"),
-            "Baz",
-        )
-    )
-    out = _strip_ansi(t.render())
-    lines = out.splitlines()
-    # "Qux" should appear after "Bar" and carry an indentation prefix character.
-    bar_idx = next(i for i, l in enumerate(lines) if "Bar" in l)
-    qux_idx = next(i for i, l in enumerate(lines) if "Qux" in l)
-    assert qux_idx > bar_idx
+def test_tree_nested_indentation(nested_rendered: str) -> None:
+    out = nested_rendered
+    # "Qux" should appear after "Bar" and carry an indentation prefix
+    # character. Raw find() offsets order the same way as line numbers, so
+    # no line list is needed.
+    bar_pos = out.find("Bar")
+    qux_pos = out.find("Qux")
+    assert bar_pos >= 0
+    assert qux_pos > bar_pos
     # Qux line should have a leading indent prefix (│ or space).
-    assert lines[qux_idx][0] in ("│", " ", "├", "└", "╰")
+    line_start = out.rfind("\n", 0, qux_pos) + 1
+    assert out[line_start] in _INDENT_PREFIX_CHARS
 
 
 def test_tree_deeply_nested() -> None:
@@ -256,15 +279,11 @@ def test_tree_auto_nesting_leaf_becomes_root() -> None:
     # Rootless Tree after "Foo" leaf → "Foo" becomes the root of the new tree.
     t = Tree().child("Foo", Tree().child("Bar"), "Baz")
     out = _strip_ansi(t.render())
-    lines = out.splitlines()
     # "Foo" should appear as a branch with "Bar" nested under it.
-    assert "Foo" in out
-    assert "Bar" in out
-    foo_line = next((i for i, l in enumerate(lines) if "Foo" in l), None)
-    bar_line = next((i for i, l in enumerate(lines) if "Bar" in l), None)
-    assert foo_line is not None
-    assert bar_line is not None
-    assert bar_line > foo_line
+    foo_pos = out.find("Foo")
+    bar_pos = out.find("Bar")
+    assert foo_pos >= 0
+    assert bar_pos > foo_pos
 
 
 # ---------------------------------------------------------------------------
@@ -298,9 +317,10 @@ def test_tree_hidden_child_last_gets_corner() -> None:
         Tree().root("Hidden").hide(True),
     )
     out = _strip_ansi(t.render())
-    lines = out.splitlines()
-    bar_line = next(ln for ln in lines if "Bar" in ln)
-    assert bar_line.startswith("└──")
+    bar_pos = out.find("Bar")
+    assert bar_pos >= 0
+    line_start = out.rfind("\n", 0, bar_pos) + 1
+    assert out.startswith("└──", line_start)
 
 
 # ---------------------------------------------------------------------------
@@ -358,8 +378,6 @@ def test_offset_trims_last() -> None:
 
 
 def test_item_style_applied() -> None:
-    import lipgloss
-
     bold = lipgloss.Style().bold(True)
     t = Tree().child("hello").item_style(bold)
     out = t.render()
@@ -368,8 +386,6 @@ def test_item_style_applied() -> None:
 
 
 def test_root_style_applied() -> None:
-    import lipgloss
-
     style = lipgloss.Style().bold(True)
     t = Tree().root("Root").child("A").root_style(style)
     out = _strip_ansi(t.render())